@@ -3,7 +3,6 @@
 import sys
 
 import typer
-from rich.console import Console
 
 from . import __version__
 from .client import TestRailClient
@@ -30,6 +29,7 @@ from .commands import (
     users,
 )
 from .config import resolve_config
+from .io import console
 
 app = typer.Typer(
     help="TestRail CLI - Python CLI for complete TestRail REST API access",
@@ -54,7 +54,7 @@ quiet_option = typer.Option(False, help="Quiet mode (suppress info)")
 def _version_callback(value: bool) -> None:
     """Print version and exit when --version is provided."""
     if value:
-        Console().print(f"TestRail CLI version {__version__}")
+        console.print(f"TestRail CLI version {__version__}")
         raise typer.Exit()
 
 
@@ -127,8 +127,7 @@ def main(
 
     except Exception as e:
         if not quiet:
-            error_console = Console()
-            error_console.print(f"[red]Configuration error: {e}[/red]")
+            console.print(f"[red]Configuration error: {e}[/red]")
         sys.exit(1)
 
 
@@ -15,7 +15,7 @@ def add_attachment_to_result(
     ctx: typer.Context,
     result_id: int = typer.Option(..., help="Result ID"),
     file_path: str = typer.Option(..., help="Path to file to attach"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add an attachment to a result."""
     client: TestRailClient = ctx.obj["client"]
@@ -37,7 +37,7 @@ def add_attachment_to_case(
     ctx: typer.Context,
     case_id: int = typer.Option(..., help="Case ID"),
     file_path: str = typer.Option(..., help="Path to file to attach"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add an attachment to a case."""
     client: TestRailClient = ctx.obj["client"]
@@ -59,7 +59,7 @@ def add_attachment_to_run(
     ctx: typer.Context,
     run_id: int = typer.Option(..., help="Run ID"),
     file_path: str = typer.Option(..., help="Path to file to attach"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add an attachment to a run."""
     client: TestRailClient = ctx.obj["client"]
@@ -81,7 +81,7 @@ def add_attachment_to_plan(
     ctx: typer.Context,
     plan_id: int = typer.Option(..., help="Plan ID"),
     file_path: str = typer.Option(..., help="Path to file to attach"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add an attachment to a plan."""
     client: TestRailClient = ctx.obj["client"]
@@ -102,7 +102,7 @@ def add_attachment_to_plan(
 def list_attachments_for_case(
     ctx: typer.Context,
     case_id: int = typer.Option(..., help="Case ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """List attachments for a case."""
@@ -119,7 +119,7 @@ def list_attachments_for_case(
 def list_attachments_for_run(
     ctx: typer.Context,
     run_id: int = typer.Option(..., help="Run ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """List attachments for a run."""
@@ -11,15 +11,18 @@ app = typer.Typer(help="Manage case fields")
 @app.command("list")
 def list_case_fields(
     ctx: typer.Context,
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all case fields."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         case_fields = client.call("get_case_fields", "GET")
-        output_result(case_fields, output, fields)
+        output_result(case_fields, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -30,7 +33,7 @@ def add_case_field(
     type: str = typer.Option(..., help="Field type"),
     name: str = typer.Option(..., help="Field name"),
     label: str = typer.Option(..., help="Field label"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add a custom case field."""
     client: TestRailClient = ctx.obj["client"]
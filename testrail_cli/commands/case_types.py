@@ -11,14 +11,17 @@ app = typer.Typer(help="Manage case types")
 @app.command("list")
 def list_case_types(
     ctx: typer.Context,
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all available case types."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         case_types = client.call("get_case_types", "GET")
-        output_result(case_types, output, fields)
+        output_result(case_types, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
@@ -26,8 +26,11 @@ def list_cases(
     case_ids: str | None = typer.Option(None, help="Case ID(s), comma-separated"),
     limit: int | None = typer.Option(None, help="Limit results"),
     offset: int | None = typer.Option(None, help="Offset for pagination"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List test cases."""
     client: TestRailClient = ctx.obj["client"]
@@ -67,7 +70,7 @@ def list_cases(
 
             cases = client.get_cases(project_id, **kwargs)
 
-        output_result(cases, output, fields)
+        output_result(cases, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -76,7 +79,7 @@ def list_cases(
 def get_case(
     ctx: typer.Context,
     case_id: int = typer.Argument(..., help="Case ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific test case by ID."""
@@ -102,7 +105,7 @@ def add_case(
     json_file: str | None = typer.Option(
         None, "--json", "--file", help="JSON file path or '-' for stdin"
     ),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Create a new test case."""
     client: TestRailClient = ctx.obj["client"]
@@ -165,7 +168,7 @@ def update_case(
     json_file: str | None = typer.Option(
         None, "--json", "--file", help="JSON file path or '-' for stdin"
     ),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Update a test case."""
     client: TestRailClient = ctx.obj["client"]
@@ -241,6 +244,9 @@ def import_cases(
     ),
     create_missing_sections: bool = typer.Option(False, help="Create sections if missing"),
     chunk_size: int = typer.Option(50, help="Batch size for API calls"),
+    workers: int = typer.Option(
+        1, help="Concurrent update requests per batch (new cases are added in CSV order)"
+    ),
 ) -> None:
     """Import test cases from CSV."""
     from ..csv_import import import_cases_from_csv
@@ -260,6 +266,7 @@ def import_cases(
             steps_field=steps_field,
             create_missing_sections=create_missing_sections,
             chunk_size=chunk_size,
+            max_workers=workers,
         )
 
         typer.echo(f"Created: {result['created']}")
@@ -15,8 +15,11 @@ def list_milestones(
     is_completed: int | None = typer.Option(
         None, help="Filter by completion (0=active, 1=completed)"
     ),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List milestones in a project."""
     client: TestRailClient = ctx.obj["client"]
@@ -27,7 +30,7 @@ def list_milestones(
             kwargs["is_completed"] = is_completed
 
         milestones = client.get_milestones(project_id, **kwargs)
-        output_result(milestones, output, fields)
+        output_result(milestones, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -36,7 +39,7 @@ def list_milestones(
 def get_milestone(
     ctx: typer.Context,
     milestone_id: int = typer.Argument(..., help="Milestone ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific milestone by ID."""
@@ -58,7 +61,7 @@ def add_milestone(
     due_on: str | None = typer.Option(None, help="Due date (ISO8601 or epoch)"),
     parent_id: int | None = typer.Option(None, help="Parent milestone ID"),
     start_on: str | None = typer.Option(None, help="Start date (ISO8601 or epoch)"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Create a new milestone."""
     client: TestRailClient = ctx.obj["client"]
@@ -89,7 +92,7 @@ def update_milestone(
     due_on: str | None = typer.Option(None, help="Due date (ISO8601 or epoch)"),
     is_completed: bool | None = typer.Option(None, help="Mark as completed"),
     start_on: str | None = typer.Option(None, help="Start date (ISO8601 or epoch)"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Update a milestone."""
     client: TestRailClient = ctx.obj["client"]
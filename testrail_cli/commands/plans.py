@@ -19,8 +19,11 @@ def list_plans(
     ),
     limit: int | None = typer.Option(None, help="Limit results"),
     offset: int | None = typer.Option(None, help="Offset for pagination"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List test plans."""
     client: TestRailClient = ctx.obj["client"]
@@ -39,7 +42,7 @@ def list_plans(
             kwargs["offset"] = offset
 
         plans = client.get_plans(project_id, **kwargs)
-        output_result(plans, output, fields)
+        output_result(plans, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -48,7 +51,7 @@ def list_plans(
 def get_plan(
     ctx: typer.Context,
     plan_id: int = typer.Argument(..., help="Plan ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific test plan by ID."""
@@ -68,7 +71,7 @@ def add_plan(
     name: str = typer.Option(..., help="Plan name"),
     description: str | None = typer.Option(None, help="Plan description"),
     milestone_id: int | None = typer.Option(None, help="Milestone ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Create a new test plan."""
     client: TestRailClient = ctx.obj["client"]
@@ -93,7 +96,7 @@ def update_plan(
     name: str | None = typer.Option(None, help="Plan name"),
     description: str | None = typer.Option(None, help="Plan description"),
     milestone_id: int | None = typer.Option(None, help="Milestone ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Update a test plan."""
     client: TestRailClient = ctx.obj["client"]
@@ -117,7 +120,7 @@ def update_plan(
 def close_plan(
     ctx: typer.Context,
     plan_id: int = typer.Argument(..., help="Plan ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Close a test plan."""
     client: TestRailClient = ctx.obj["client"]
@@ -11,14 +11,17 @@ app = typer.Typer(help="Manage case priorities")
 @app.command("list")
 def list_priorities(
     ctx: typer.Context,
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all available case priorities."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         priorities = client.call("get_priorities", "GET")
-        output_result(priorities, output, fields)
+        output_result(priorities, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
@@ -14,15 +14,18 @@ def list_projects(
     is_completed: int | None = typer.Option(
         None, help="Filter by completion status (0=active, 1=completed)"
     ),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all projects."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         projects = client.get_projects(is_completed=is_completed)
-        output_result(projects, output, fields)
+        output_result(projects, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -31,7 +34,7 @@ def list_projects(
 def get_project(
     ctx: typer.Context,
     project_id: int = typer.Argument(..., help="Project ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific project by ID."""
@@ -53,7 +56,7 @@ def add_project(
     suite_mode: int | None = typer.Option(
         None, help="Suite mode (1=single, 2=single+baselines, 3=multiple)"
     ),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Create a new project."""
     client: TestRailClient = ctx.obj["client"]
@@ -81,7 +84,7 @@ def update_project(
     announcement: str | None = typer.Option(None, help="Project announcement"),
     show_announcement: bool | None = typer.Option(None, help="Show announcement"),
     is_completed: bool | None = typer.Option(None, help="Mark as completed"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Update a project."""
     client: TestRailClient = ctx.obj["client"]
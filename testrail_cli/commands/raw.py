@@ -19,7 +19,7 @@ def raw(
     params: list[str] | None = typer.Option(None, help="Query params as key=value (repeatable)"),  # noqa: B008
     data: list[str] | None = typer.Option(None, help="Request body data as key=value (repeatable)"),  # noqa: B008
     payload_file: str | None = typer.Option(None, help="Path to JSON/YAML file for request body"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Make a raw API call to any TestRail endpoint.
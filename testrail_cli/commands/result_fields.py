@@ -11,14 +11,17 @@ app = typer.Typer(help="Manage result fields")
 @app.command("list")
 def list_result_fields(
     ctx: typer.Context,
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all result fields."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         result_fields = client.call("get_result_fields", "GET")
-        output_result(result_fields, output, fields)
+        output_result(result_fields, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
@@ -17,8 +17,11 @@ def list_results(
     status_id: str | None = typer.Option(None, help="Status ID(s), comma-separated"),
     limit: int | None = typer.Option(None, help="Limit results"),
     offset: int | None = typer.Option(None, help="Offset for pagination"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List results for a test."""
     client: TestRailClient = ctx.obj["client"]
@@ -33,7 +36,7 @@ def list_results(
             kwargs["offset"] = str(offset)  # type: ignore[assignment]
 
         results = client.get_results(test_id, **kwargs)
-        output_result(results, output, fields)
+        output_result(results, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -46,7 +49,7 @@ def list_results_for_case(
     status_id: str | None = typer.Option(None, help="Status ID(s), comma-separated"),
     limit: int | None = typer.Option(None, help="Limit results"),
     offset: int | None = typer.Option(None, help="Offset for pagination"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """List results for a test case in a run."""
@@ -76,7 +79,7 @@ def list_results_for_run(
     created_before: str | None = typer.Option(None, help="Created before (ISO8601 or epoch)"),
     limit: int | None = typer.Option(None, help="Limit results"),
     offset: int | None = typer.Option(None, help="Offset for pagination"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """List results for a run."""
@@ -110,7 +113,7 @@ def add_result(
     version: str | None = typer.Option(None, help="Version tested"),
     elapsed: str | None = typer.Option(None, help="Elapsed time (e.g., '30s', '1m')"),
     defects: str | None = typer.Option(None, help="Defects (comma-separated)"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add a result for a test."""
     client: TestRailClient = ctx.obj["client"]
@@ -142,7 +145,7 @@ def add_result_for_case(
     version: str | None = typer.Option(None, help="Version tested"),
     elapsed: str | None = typer.Option(None, help="Elapsed time"),
     defects: str | None = typer.Option(None, help="Defects (comma-separated)"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add a result for a case in a run."""
     client: TestRailClient = ctx.obj["client"]
@@ -169,7 +172,7 @@ def add_results_bulk(
     ctx: typer.Context,
     run_id: int = typer.Option(..., help="Run ID"),
     results_file: str = typer.Option(..., help="Path to JSON file with results array"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add multiple results for a run (bulk operation)."""
     client: TestRailClient = ctx.obj["client"]
@@ -196,7 +199,7 @@ def add_results_bulk_for_cases(
     ctx: typer.Context,
     run_id: int = typer.Option(..., help="Run ID"),
     results_file: str = typer.Option(..., help="Path to JSON file with results array"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Add multiple results for cases in a run (bulk operation)."""
     client: TestRailClient = ctx.obj["client"]
@@ -21,8 +21,11 @@ def list_runs(
     ),
     limit: int | None = typer.Option(None, help="Limit results"),
     offset: int | None = typer.Option(None, help="Offset for pagination"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List test runs."""
     client: TestRailClient = ctx.obj["client"]
@@ -45,7 +48,7 @@ def list_runs(
             kwargs["offset"] = str(offset)
 
         runs = client.get_runs(project_id, **kwargs)
-        output_result(runs, output, fields)
+        output_result(runs, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -54,7 +57,7 @@ def list_runs(
 def get_run(
     ctx: typer.Context,
     run_id: int = typer.Argument(..., help="Run ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific test run by ID."""
@@ -78,7 +81,7 @@ def add_run(
     assignedto_id: int | None = typer.Option(None, help="Assigned to user ID"),
     include_all: bool | None = typer.Option(None, help="Include all test cases"),
     case_ids: str | None = typer.Option(None, help="Specific case IDs (comma-separated)"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Create a new test run."""
     client: TestRailClient = ctx.obj["client"]
@@ -115,7 +118,7 @@ def update_run(
     milestone_id: int | None = typer.Option(None, help="Milestone ID"),
     include_all: bool | None = typer.Option(None, help="Include all test cases"),
     case_ids: str | None = typer.Option(None, help="Specific case IDs (comma-separated)"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Update a test run."""
     client: TestRailClient = ctx.obj["client"]
@@ -143,7 +146,7 @@ def update_run(
 def close_run(
     ctx: typer.Context,
     run_id: int = typer.Argument(..., help="Run ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Close a test run."""
     client: TestRailClient = ctx.obj["client"]
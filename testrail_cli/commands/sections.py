@@ -13,15 +13,18 @@ def list_sections(
     ctx: typer.Context,
     project_id: int = typer.Option(..., help="Project ID"),
     suite_id: int | None = typer.Option(None, help="Suite ID filter"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all sections in a project."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         sections = client.get_sections(project_id, suite_id=suite_id)
-        output_result(sections, output, fields)
+        output_result(sections, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -30,7 +33,7 @@ def list_sections(
 def get_section(
     ctx: typer.Context,
     section_id: int = typer.Argument(..., help="Section ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific section by ID."""
@@ -51,7 +54,7 @@ def add_section(
     suite_id: int | None = typer.Option(None, help="Suite ID"),
     parent_id: int | None = typer.Option(None, help="Parent section ID"),
     description: str | None = typer.Option(None, help="Section description"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Create a new section."""
     client: TestRailClient = ctx.obj["client"]
@@ -77,7 +80,7 @@ def update_section(
     section_id: int = typer.Argument(..., help="Section ID"),
     name: str | None = typer.Option(None, help="Section name"),
     description: str | None = typer.Option(None, help="Section description"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Update a section."""
     client: TestRailClient = ctx.obj["client"]
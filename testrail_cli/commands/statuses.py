@@ -11,14 +11,17 @@ app = typer.Typer(help="Manage test statuses")
 @app.command("list")
 def list_statuses(
     ctx: typer.Context,
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all available test statuses."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         statuses = client.call("get_statuses", "GET")
-        output_result(statuses, output, fields)
+        output_result(statuses, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
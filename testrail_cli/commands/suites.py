@@ -12,15 +12,18 @@ app = typer.Typer(help="Manage test suites")
 def list_suites(
     ctx: typer.Context,
     project_id: int = typer.Option(..., help="Project ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all suites in a project."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         suites = client.get_suites(project_id)
-        output_result(suites, output, fields)
+        output_result(suites, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -29,7 +32,7 @@ def list_suites(
 def get_suite(
     ctx: typer.Context,
     suite_id: int = typer.Argument(..., help="Suite ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific suite by ID."""
@@ -48,7 +51,7 @@ def add_suite(
     project_id: int = typer.Option(..., help="Project ID"),
     name: str = typer.Option(..., help="Suite name"),
     description: str | None = typer.Option(None, help="Suite description"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Create a new suite."""
     client: TestRailClient = ctx.obj["client"]
@@ -70,7 +73,7 @@ def update_suite(
     suite_id: int = typer.Argument(..., help="Suite ID"),
     name: str | None = typer.Option(None, help="Suite name"),
     description: str | None = typer.Option(None, help="Suite description"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
 ) -> None:
     """Update a suite."""
     client: TestRailClient = ctx.obj["client"]
@@ -15,8 +15,11 @@ def list_tests(
     status_id: str | None = typer.Option(None, help="Status ID(s), comma-separated"),
     limit: int | None = typer.Option(None, help="Limit results"),
     offset: int | None = typer.Option(None, help="Offset for pagination"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List tests in a run."""
     client: TestRailClient = ctx.obj["client"]
@@ -31,7 +34,7 @@ def list_tests(
             kwargs["offset"] = str(offset)  # type: ignore[assignment]
 
         tests = client.get_tests(run_id, **kwargs)
-        output_result(tests, output, fields)
+        output_result(tests, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -40,7 +43,7 @@ def list_tests(
 def get_test(
     ctx: typer.Context,
     test_id: int = typer.Argument(..., help="Test ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific test by ID."""
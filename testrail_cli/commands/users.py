@@ -11,15 +11,18 @@ app = typer.Typer(help="Manage users")
 @app.command("list")
 def list_users(
     ctx: typer.Context,
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
+    stream: bool = typer.Option(
+        False, "--stream/--no-stream", help="Render large tables in chunks"
+    ),
 ) -> None:
     """List all users."""
     client: TestRailClient = ctx.obj["client"]
 
     try:
         users = client.get_users()
-        output_result(users, output, fields)
+        output_result(users, output, fields, stream)
     except Exception as e:
         handle_api_error(e)
 
@@ -28,7 +31,7 @@ def list_users(
 def get_user(
     ctx: typer.Context,
     user_id: int = typer.Argument(..., help="User ID"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a specific user by ID."""
@@ -45,7 +48,7 @@ def get_user(
 def get_user_by_email(
     ctx: typer.Context,
     email: str = typer.Argument(..., help="User email"),
-    output: str = typer.Option("json", help="Output format (json, table, raw)"),
+    output: str = typer.Option("json", help="Output format (json, jsonl, table, raw)"),
     fields: str | None = typer.Option(None, help="Comma-separated field list"),
 ) -> None:
     """Get a user by email address."""
@@ -9,6 +9,14 @@ from typing import Any
 
 import yaml
 
+# libyaml-backed loader/dumper when PyYAML was built with it; same safe subset of YAML
+try:
+    from yaml import CSafeDumper as _SafeDumper
+    from yaml import CSafeLoader as _SafeLoader
+except ImportError:  # pragma: no cover - PyYAML without libyaml
+    from yaml import SafeDumper as _SafeDumper  # type: ignore[assignment]
+    from yaml import SafeLoader as _SafeLoader  # type: ignore[assignment]
+
 
 def load_config(config_path: str | None = None) -> dict[str, Any]:
     """Load configuration from file.
@@ -49,7 +57,7 @@ def _read_yaml(path: Path) -> dict[str, Any]:
     """Read and parse YAML config file."""
     try:
         with open(path) as f:
-            config = yaml.safe_load(f) or {}
+            config = yaml.load(f, Loader=_SafeLoader) or {}
 
         # Check file permissions on POSIX systems
         # Note: Windows users should ensure config file is not shared or accessible to other users
@@ -131,7 +139,7 @@ def init_config(
     existing_config: dict[str, Any] = {}
     if config_path.exists():
         with open(config_path) as f:
-            existing_config = yaml.safe_load(f) or {}
+            existing_config = yaml.load(f, Loader=_SafeLoader) or {}
 
     # Ensure profiles key exists
     if "profiles" not in existing_config:
@@ -150,7 +158,7 @@ def init_config(
     config_dir = config_path.parent
     with tempfile.NamedTemporaryFile(mode="w", dir=config_dir, delete=False, suffix=".tmp") as f:
         temp_path = Path(f.name)
-        yaml.safe_dump(existing_config, f, default_flow_style=False, sort_keys=False)
+        yaml.dump(existing_config, f, Dumper=_SafeDumper, default_flow_style=False, sort_keys=False)
 
     # Set permissions on temp file before moving (POSIX only)
     if sys.platform != "win32":
@@ -1,14 +1,20 @@
 """CSV import functionality for test cases."""
 
+import contextlib
 import csv
+import functools
 import json
 import re
+from collections import defaultdict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, TextIO
 
 import yaml
 
 from .client import TestRailClient
+from .io import extract_paginated_data
 
 
 def load_mapping(mapping_path: str) -> dict[str, Any]:
@@ -70,6 +76,44 @@ STANDARD_FIELDS = {
 }
 
 
+# Column names recognised as per-row step parts (compared lowercased)
+_STEP_KEYS = frozenset({"step", "step_content", "action"})
+_EXPECTED_KEYS = frozenset({"expected", "expected_result"})
+_INFO_KEYS = frozenset({"additional_info", "info", "notes", "note", "data", "test_data"})
+
+# Columns holding a full step list in a single cell
+_STRUCTURED_STEP_FIELDS = frozenset(
+    {"teststeps", "test_steps", "steps_separated", "custom_steps_separated"}
+)
+
+# Step-routing hints that never reach the API payload
+_STEP_META_KEYS = frozenset(
+    {"steps_field", "step_field", "steps_target", "template", "template_name"}
+)
+
+# File buffer for CSV import/export, so large files move in a few big syscalls
+_CSV_BUFFER_SIZE = 1 << 20
+
+# Column order of exported CSVs; import accepts the same layout
+EXPORT_FIELDNAMES: tuple[str, ...] = (
+    "case_id",
+    "title",
+    "section",
+    "priority_id",
+    "type_id",
+    "template_id",
+    "estimate",
+    "refs",
+    "mission",
+    "goals",
+    "preconds",
+    "step",
+    "expected",
+    "additional_info",
+)
+_STEP_COLUMN = EXPORT_FIELDNAMES.index("step")
+
+
 def _apply_standard_mapping(row: dict[str, Any]) -> dict[str, Any]:
     """Apply standard field mapping for common templates."""
     mapped = dict(row)
@@ -221,18 +265,19 @@ def infer_step_target_field(row: dict[str, Any]) -> tuple[str, set[str]]:
 
 def format_steps_as_text(steps: list[dict[str, str]]) -> str:
     """Convert structured steps into a text blob for text templates."""
-    lines = []
+    lines: list[str] = []
+    append = lines.append
     for step in steps:
-        parts = [step.get("content", "").strip()]
+        content = step.get("content", "").strip()
+        parts = [content] if content else []
         expected = step.get("expected", "").strip()
         additional = step.get("additional_info", "").strip()
         if expected:
             parts.append(f"Expected: {expected}")
         if additional:
             parts.append(f"Info: {additional}")
-        composed = " | ".join(p for p in parts if p)
-        if composed:
-            lines.append(composed)
+        if parts:
+            append(" | ".join(parts))
     return "\n".join(lines)
 
 
@@ -269,21 +314,60 @@ def _get_section_path(client: TestRailClient, section_id: int, cache: dict[int,
     return path
 
 
-def case_to_rows(case: dict[str, Any], section_path: str) -> list[dict[str, Any]]:
-    """Convert a TestRail case dict into CSV step rows."""
-    base = {
-        "case_id": case.get("id"),
-        "title": case.get("title", ""),
-        "section": section_path,
-        "priority_id": case.get("priority_id"),
-        "type_id": case.get("type_id"),
-        "template_id": case.get("template_id"),
-        "estimate": case.get("estimate"),
-        "refs": case.get("refs"),
-        "mission": case.get("custom_mission"),
-        "goals": case.get("custom_goals"),
-        "preconds": case.get("custom_preconds"),
-    }
+def _prefetch_section_paths(
+    client: TestRailClient, project_id: int, suite_ids: set[int], cache: dict[int, str]
+) -> None:
+    """Fill cache with the full path of every section in the given suites.
+
+    One get_sections call per suite replaces a get_section call per distinct
+    section. Only the first page of a paginated listing is read; sections
+    missing from it (or whose parent is) are left for _get_section_path to
+    resolve.
+    """
+    sections: dict[int, dict[str, Any]] = {}
+    for suite_id in suite_ids:
+        listing = extract_paginated_data(client.get_sections(project_id, suite_id=suite_id))
+        for section in listing:
+            sections[section["id"]] = section
+
+    def path_of(section_id: int) -> str | None:
+        if section_id in cache:
+            return cache[section_id]
+        section = sections.get(section_id)
+        if section is None:
+            return None
+        parent_id = section.get("parent_id")
+        if parent_id:
+            parent_path = path_of(parent_id)
+            if parent_path is None:
+                return None
+            path = f"{parent_path}/{section['name']}"
+        else:
+            path = section["name"]
+        cache[section_id] = path
+        return path
+
+    for section_id in sections:
+        path_of(section_id)
+
+
+def _case_export_parts(
+    case: dict[str, Any], section_path: str
+) -> tuple[list[Any], list[tuple[Any, Any, Any]]]:
+    """Split a case into its shared column values and one (step, expected, info) per row."""
+    base = [
+        case.get("id"),
+        case.get("title", ""),
+        section_path,
+        case.get("priority_id"),
+        case.get("type_id"),
+        case.get("template_id"),
+        case.get("estimate"),
+        case.get("refs"),
+        case.get("custom_mission"),
+        case.get("custom_goals"),
+        case.get("custom_preconds"),
+    ]
 
     steps = case.get("custom_steps_separated") or []
     if not steps and case.get("custom_steps"):
@@ -300,28 +384,24 @@ def case_to_rows(case: dict[str, Any], section_path: str) -> list[dict[str, Any]
             if line
         ]
 
-    rows: list[dict[str, Any]] = []
     if not steps:
-        rows.append({**base, "step": "", "expected": "", "additional_info": ""})
-        return rows
+        return base, [("", "", "")]
+    return base, [
+        (step.get("content", ""), step.get("expected", ""), step.get("additional_info", ""))
+        for step in steps
+    ]
 
-    for step in steps:
-        rows.append(
-            {
-                **base,
-                "step": step.get("content", ""),
-                "expected": step.get("expected", ""),
-                "additional_info": step.get("additional_info", ""),
-            }
-        )
 
-    return rows
+def case_to_rows(case: dict[str, Any], section_path: str) -> list[dict[str, Any]]:
+    """Convert a TestRail case dict into CSV step rows."""
+    base, steps = _case_export_parts(case, section_path)
+    return [dict(zip(EXPORT_FIELDNAMES, (*base, *step), strict=True)) for step in steps]
 
 
 def export_cases_to_csv(
     client: TestRailClient,
     project_id: int,
-    csv_path: str,
+    csv_path: str | Path | TextIO,
     suite_id: int | None = None,
     case_ids: list[int] | None = None,
     section_id: int | None = None,
@@ -347,37 +427,72 @@ def export_cases_to_csv(
             kwargs["type_id"] = type_ids
         cases = client.get_cases(project_id, **kwargs)
 
-    rows: list[dict[str, Any]] = []
-    for case in cases:
-        section_path = ""
-        if case.get("section_id"):
-            section_path = _get_section_path(client, int(case["section_id"]), section_cache)
-        rows.extend(case_to_rows(case, section_path))
-
-    fieldnames = [
-        "case_id",
-        "title",
-        "section",
-        "priority_id",
-        "type_id",
-        "template_id",
-        "estimate",
-        "refs",
-        "mission",
-        "goals",
-        "preconds",
-        "step",
-        "expected",
-        "additional_info",
+    # Resolve section paths before opening the file so API errors leave no partial export
+    suite_ids = {case["suite_id"] for case in cases if case.get("suite_id")}
+    if suite_ids:
+        _prefetch_section_paths(client, project_id, suite_ids, section_cache)
+    section_paths = [
+        _get_section_path(client, int(case["section_id"]), section_cache)
+        if case.get("section_id")
+        else ""
+        for case in cases
     ]
-    Path(csv_path).parent.mkdir(parents=True, exist_ok=True)
-    with open(csv_path, "w", newline="") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(row)
 
-    return {"exported": len(rows)}
+    # Rows are built and written serially on purpose: the per-case transform is a
+    # few microseconds per row, cheaper than pickling cases out to worker processes,
+    # and negligible next to fetching the cases from TestRail in the first place.
+    exported = 0
+    if isinstance(csv_path, str | Path):
+        Path(csv_path).parent.mkdir(parents=True, exist_ok=True)
+    # Streams are written in place and left open for the caller
+    with (
+        open(csv_path, "w", newline="", buffering=_CSV_BUFFER_SIZE)
+        if isinstance(csv_path, str | Path)
+        else contextlib.nullcontext(csv_path)
+    ) as f:
+        writer = csv.writer(f)
+        writer.writerow(EXPORT_FIELDNAMES)
+        for case, section_path in zip(cases, section_paths, strict=True):
+            base, steps = _case_export_parts(case, section_path)
+            # One row buffer per case; only the trailing step columns change per step
+            row = [*base, "", "", ""]
+            for step in steps:
+                row[_STEP_COLUMN:] = step
+                writer.writerow(row)
+            exported += len(steps)
+
+    return {"exported": exported}
+
+
+_NUMBERED_STEP_RE = re.compile(r"step[\s_]*(\d+)$")
+_NUMBERED_EXPECTED_RE = re.compile(r"(?:expected|exp)[\s_]*(\d+)$")
+_NUMBERED_INFO_RE = re.compile(
+    r"(?:additional(?:_info)?|info|notes?|note|data|test[_\s]?data)[\s_]*(\d+)$"
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _numbered_step_column(key: str) -> tuple[str, int] | None:
+    """Classify a numbered step column (step_1, expected_1, info_1, ...).
+
+    Every row repeats the same header keys, so the regex work is cached per key.
+
+    Args:
+        key: CSV column name
+
+    Returns:
+        (step dict key, step index), or None for any other column
+    """
+    lower_key = key if key.islower() else key.lower()
+    for step_key, pattern in (
+        ("content", _NUMBERED_STEP_RE),
+        ("expected", _NUMBERED_EXPECTED_RE),
+        ("additional_info", _NUMBERED_INFO_RE),
+    ):
+        match = pattern.match(lower_key)
+        if match:
+            return step_key, int(match.group(1))
+    return None
 
 
 def normalize_row(row: dict[str, Any], row_num: int) -> tuple[dict[str, Any], list[str]]:
@@ -400,24 +515,10 @@ def normalize_row(row: dict[str, Any], row_num: int) -> tuple[dict[str, Any], li
         if value is None:
             continue
 
-        lower_key = key.lower()
-        step_match = re.match(r"step[\s_]*(\d+)$", lower_key)
-        expected_match = re.match(r"(expected|exp)[\s_]*(\d+)$", lower_key)
-        info_match = re.match(
-            r"(additional(_info)?|info|notes?|note|data|test[_\s]?data)[\s_]*(\d+)$", lower_key
-        )
-
-        if step_match:
-            idx = int(step_match.group(1))
-            step_fields.setdefault(idx, {})["content"] = str(value).strip()
-            keys_to_remove.add(key)
-        elif expected_match:
-            idx = int(expected_match.group(2))
-            step_fields.setdefault(idx, {})["expected"] = str(value).strip()
-            keys_to_remove.add(key)
-        elif info_match:
-            idx = int(info_match.group(3))
-            step_fields.setdefault(idx, {})["additional_info"] = str(value).strip()
+        column = _numbered_step_column(key)
+        if column:
+            step_key, idx = column
+            step_fields.setdefault(idx, {})[step_key] = str(value).strip()
             keys_to_remove.add(key)
 
     steps: list[dict[str, str]] = []
@@ -434,18 +535,12 @@ def normalize_row(row: dict[str, Any], row_num: int) -> tuple[dict[str, Any], li
                 steps.append(step_dict)
 
     # Parse combined test step fields
-    structured_step_fields = {
-        "teststeps",
-        "test_steps",
-        "steps_separated",
-        "custom_steps_separated",
-    }
     for key in list(normalized.keys()):
         if key in keys_to_remove:
             continue
 
-        lower_key = key.lower()
-        if lower_key in structured_step_fields:
+        lower_key = key if key.islower() else key.lower()
+        if lower_key in _STRUCTURED_STEP_FIELDS:
             parsed_steps, parse_errors = parse_steps_value(normalized[key], row_num, key)
             steps.extend(parsed_steps)
             errors.extend(parse_errors)
@@ -460,8 +555,7 @@ def normalize_row(row: dict[str, Any], row_num: int) -> tuple[dict[str, Any], li
         else:
             normalized["custom_steps_separated"] = steps
 
-    meta_keys = {"steps_field", "step_field", "steps_target", "template", "template_name"}
-    for key in keys_to_remove.union(meta_keys):
+    for key in keys_to_remove.union(_STEP_META_KEYS):
         normalized.pop(key, None)
 
     return normalized, errors
@@ -480,15 +574,15 @@ def extract_steps_and_clean(
     content = ""
     expected = ""
     additional_info = ""
-    for key, value in list(cleaned.items()):
-        lower_key = key.lower()
-        if lower_key in {"step", "step_content", "action"}:
+    for key, value in cleaned.items():
+        lower_key = key if key.islower() else key.lower()
+        if lower_key in _STEP_KEYS:
             content = str(value or "").strip()
             keys_to_remove.add(key)
-        elif lower_key in {"expected", "expected_result"}:
+        elif lower_key in _EXPECTED_KEYS:
             expected = str(value or "").strip()
             keys_to_remove.add(key)
-        elif lower_key in {"additional_info", "info", "notes", "note", "data", "test_data"}:
+        elif lower_key in _INFO_KEYS:
             additional_info = str(value or "").strip()
             keys_to_remove.add(key)
 
@@ -536,6 +630,10 @@ def merge_base_data(existing: dict[str, Any], incoming: dict[str, Any], row_num:
     """Ensure repeated rows of the same case keep consistent values."""
     errors: list[str] = []
     for key, value in incoming.items():
+        current = existing.get(key)
+        # Continuation rows usually repeat the case's values verbatim
+        if current and current == value:
+            continue
         if value is None or str(value).strip() == "":
             continue
         if key not in existing or not existing.get(key):
@@ -583,12 +681,22 @@ def resolve_suite(
     raise ValueError("suite_id or suite_name is required for multi-suite projects")
 
 
+def build_section_map(sections: Any) -> dict[str, dict[str, Any]]:
+    """Index sections by name for resolve_section.
+
+    Accepts a get_sections response as returned: a bare list, or a paginated
+    page (TestRail 6.7+) whose first page of sections is indexed.
+    """
+    return {s["name"]: s for s in extract_paginated_data(sections)}
+
+
 def resolve_section(
     client: TestRailClient,
     project_id: int,
     suite_id: int,
     section_path: str | None,
     create_missing: bool = False,
+    section_map: dict[str, dict[str, Any]] | None = None,
 ) -> int | None:
     """Resolve section ID from path.
 
@@ -598,6 +706,8 @@ def resolve_section(
         suite_id: Suite ID
         section_path: Section path (e.g., "Parent/Child")
         create_missing: Whether to create missing sections
+        section_map: Optional name-to-section index of the suite, reused across
+            calls and updated in place with created sections
 
     Returns:
         Section ID or None
@@ -605,10 +715,9 @@ def resolve_section(
     if not section_path:
         return None
 
-    sections = client.get_sections(project_id, suite_id=suite_id)
-
-    # Build section hierarchy
-    section_map = {s["name"]: s for s in sections}
+    if section_map is None:
+        # Build section hierarchy
+        section_map = build_section_map(client.get_sections(project_id, suite_id=suite_id))
 
     # Parse path
     parts = section_path.split("/")
@@ -647,10 +756,38 @@ def chunk_list(items: list[Any], chunk_size: int) -> list[list[Any]]:
     return [items[i : i + chunk_size] for i in range(0, len(items), chunk_size)]
 
 
+_ClientCall = tuple[Callable[..., Any], tuple[Any, ...], dict[str, Any]]
+
+
+def _submit_calls(calls: list[_ClientCall], max_workers: int) -> list[Exception | None]:
+    """Run client calls, overlapping their round-trips when max_workers > 1.
+
+    Args:
+        calls: (method, args, kwargs) triples
+        max_workers: Maximum number of concurrent calls
+
+    Returns:
+        The exception raised by each call, or None on success, in input order
+    """
+
+    def run(call: _ClientCall) -> Exception | None:
+        func, args, kwargs = call
+        try:
+            func(*args, **kwargs)
+        except Exception as e:
+            return e
+        return None
+
+    if max_workers <= 1 or len(calls) <= 1:
+        return [run(call) for call in calls]
+    with ThreadPoolExecutor(max_workers=min(max_workers, len(calls))) as executor:
+        return list(executor.map(run, calls))
+
+
 def import_cases_from_csv(
     client: TestRailClient,
     project_id: int,
-    csv_path: str,
+    csv_path: str | Path | TextIO,
     suite_id: int | None = None,
     suite_name: str | None = None,
     section_path: str | None = None,
@@ -659,13 +796,14 @@ def import_cases_from_csv(
     steps_field: str | None = None,
     create_missing_sections: bool = False,
     chunk_size: int = 50,
+    max_workers: int = 1,
 ) -> dict[str, Any]:
     """Import test cases from CSV file.
 
     Args:
         client: TestRail client
         project_id: Project ID
-        csv_path: Path to CSV file
+        csv_path: Path to CSV file, or an already open text stream
         suite_id: Optional suite ID
         suite_name: Optional suite name
         section_path: Default section path
@@ -674,6 +812,8 @@ def import_cases_from_csv(
         steps_field: Optional target steps field override
         create_missing_sections: Whether to create missing sections
         chunk_size: Batch size for API calls
+        max_workers: Number of update calls kept in flight at once. New cases
+            are always added one at a time so they keep the CSV row order.
 
     Returns:
         Dictionary with counts: created, updated, errors
@@ -687,21 +827,48 @@ def import_cases_from_csv(
     suite_id = resolve_suite(client, project_id, suite_id, suite_name)
 
     # Resolve default section
+    # The suite's sections are listed once per import and each path resolved once
+    section_map: dict[str, dict[str, Any]] | None = None
+    section_ids: dict[str, int | None] = {}
+
+    def section_id_for(path: str) -> int | None:
+        nonlocal section_map
+        if path not in section_ids:
+            if section_map is None:
+                section_map = build_section_map(client.get_sections(project_id, suite_id=suite_id))
+            section_ids[path] = resolve_section(
+                client, project_id, suite_id, path, create_missing_sections, section_map
+            )
+        return section_ids[path]
+
     default_section_id = None
     if section_path:
-        default_section_id = resolve_section(
-            client, project_id, suite_id, section_path, create_missing_sections
-        )
-
-    # Read CSV and group rows per case (one row per step)
-    grouped: dict[tuple[Any, ...], dict[str, Any]] = {}
+        default_section_id = section_id_for(section_path)
+
+    # Stream the CSV and group rows per case (one row per step). A case's rows need
+    # not be contiguous, so groups are held until the whole file has been read.
+    # Submission therefore waits for the parse; that costs well under a second for
+    # thousands of cases, which is why no producer/consumer thread overlaps them.
+    grouped: defaultdict[tuple[Any, ...], dict[str, Any]] = defaultdict(
+        lambda: {"base": {}, "steps": []}
+    )
+    last_key: tuple[Any, ...] | None = None
+    last_group: dict[str, Any] = {}
     errors: list[str] = []
     error_details: list[str] = []
 
     try:
-        with open(csv_path) as f:
-            reader = csv.DictReader(f)
-            if "case_id" not in (reader.fieldnames or []):
+        # Streams are read in place and left open for the caller
+        with (
+            open(csv_path, newline="", buffering=_CSV_BUFFER_SIZE)
+            if isinstance(csv_path, str | Path)
+            else contextlib.nullcontext(csv_path)
+        ) as f:
+            # Plain csv.reader plus one zip per row; DictReader does the same
+            # pairing in Python for every row.
+            reader = csv.reader(f)
+            header = next(reader, [])
+            if "case_id" not in header:
                 return {
                     "created": 0,
                     "updated": 0,
@@ -710,7 +877,22 @@ def import_cases_from_csv(
                         "CSV must include 'case_id' column (may be empty for new cases)"
                     ],
                 }
-            for idx, row in enumerate(reader, start=2):  # Start at 2 (row 1 is header)
+            width = len(header)
+            idx = 1  # Row 1 is the header; blank lines are skipped without counting
+            for values in reader:
+                if not values:
+                    continue
+                idx += 1
+                if len(values) > width and any(values[width:]):
+                    err = f"Row {idx}: More values than header columns"
+                    errors.append(err)
+                    error_details.append(err)
+                    continue
+                row: dict[str, Any] = dict(zip(header, values, strict=False))
+                if len(values) < width:
+                    # Missing trailing cells read as None, as with DictReader
+                    row.update(dict.fromkeys(header[len(values) :]))
+
                 # Apply mapping
                 mapped_row = apply_mapping(row, mapping)
                 mapped_row = _apply_standard_mapping(mapped_row)
@@ -729,15 +911,18 @@ def import_cases_from_csv(
                     error_details.append(err)
                     continue
 
-                grouped.setdefault(key, {"base": {}, "steps": []})
-                merge_errors = merge_base_data(grouped[key]["base"], cleaned_row, idx)
+                # Rows of one case are usually adjacent; reuse the previous group if so
+                if key != last_key:
+                    last_key, last_group = key, grouped[key]
+                group = last_group
+                merge_errors = merge_base_data(group["base"], cleaned_row, idx)
                 if merge_errors:
                     errors.extend(merge_errors)
                     error_details.extend(merge_errors)
                     continue
 
                 if step_entries:
-                    grouped[key]["steps"].extend(step_entries)
+                    group["steps"].extend(step_entries)
     except FileNotFoundError:
         return {
             "created": 0,
@@ -770,51 +955,54 @@ def import_cases_from_csv(
         else:
             creates.append(base_row)
 
-    # Process creates
+    # Prepare creates; sections are resolved (and possibly created) one at a time
+    create_calls: list[_ClientCall] = []
+    for case_data in creates:
+        try:
+            # Determine section
+            section_id = default_section_id
+            if "section" in case_data and case_data["section"]:
+                section_id = section_id_for(case_data["section"])
+
+            if not section_id:
+                raise ValueError("Section is required for creating cases")
+
+            # Prepare case data
+            title = case_data.get("title")
+            if not title:
+                raise ValueError("Title is required for creating cases")
+
+            # Create a copy and remove non-API fields
+            api_data = dict(case_data)
+            steps = api_data.pop("__steps", [])
+            api_data.pop("title", None)
+            api_data.pop("section", None)
+            api_data.pop("case_id", None)
+            if template_id and "template_id" not in api_data:
+                api_data["template_id"] = template_id
+            if steps:
+                apply_steps_to_payload(api_data, steps, steps_field)
+
+            create_calls.append((client.add_case, (section_id, title), api_data))
+
+        except Exception as e:
+            errors.append(str(e))
+            error_details.append(f"Create error: {e}")
+
+    # Process creates one at a time: TestRail orders cases by creation, so
+    # concurrent adds would scramble the CSV row order
     created_count = 0
-    for chunk in chunk_list(creates, chunk_size):
-        for case_data in chunk:
-            try:
-                # Determine section
-                section_id = default_section_id
-                if "section" in case_data and case_data["section"]:
-                    section_id = resolve_section(
-                        client,
-                        project_id,
-                        suite_id,
-                        case_data["section"],
-                        create_missing_sections,
-                    )
-
-                if not section_id:
-                    raise ValueError("Section is required for creating cases")
-
-                # Prepare case data
-                title = case_data.get("title")
-                if not title:
-                    raise ValueError("Title is required for creating cases")
-
-                # Create a copy and remove non-API fields
-                api_data = dict(case_data)
-                steps = api_data.pop("__steps", [])
-                api_data.pop("title", None)
-                api_data.pop("section", None)
-                api_data.pop("case_id", None)
-                if template_id and "template_id" not in api_data:
-                    api_data["template_id"] = template_id
-                if steps:
-                    apply_steps_to_payload(api_data, steps, steps_field)
-
-                # Create case
-                client.add_case(section_id, title, **api_data)
+    for chunk in chunk_list(create_calls, chunk_size):
+        for error in _submit_calls(chunk, 1):
+            if error is None:
                 created_count += 1
+            else:
+                errors.append(str(error))
+                error_details.append(f"Create error: {error}")
 
-            except Exception as e:
-                errors.append(str(e))
-                error_details.append(f"Create error: {e}")
-
-    # Process updates
-    updated_count = 0
+    # Prepare updates
+    update_calls: list[_ClientCall] = []
+    update_ids: list[Any] = []
     for case_data in updates:
         try:
             case_id_str = case_data.get("case_id")
@@ -832,14 +1020,25 @@ def import_cases_from_csv(
             if steps:
                 apply_steps_to_payload(api_data, steps, steps_field)
 
-            # Update case
-            client.update_case(case_id, **api_data)
-            updated_count += 1
+            update_calls.append((client.update_case, (case_id,), api_data))
+            update_ids.append(case_id_str)
 
         except Exception as e:
             errors.append(str(e))
             error_details.append(f"Update error for case {case_id_str}: {e}")
 
+    # Process updates
+    updated_count = 0
+    for ids, chunk in zip(
+        chunk_list(update_ids, chunk_size), chunk_list(update_calls, chunk_size), strict=True
+    ):
+        for case_id_str, error in zip(ids, _submit_calls(chunk, max_workers), strict=True):
+            if error is None:
+                updated_count += 1
+            else:
+                errors.append(str(error))
+                error_details.append(f"Update error for case {case_id_str}: {error}")
+
     return {
         "created": created_count,
         "updated": updated_count,
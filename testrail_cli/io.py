@@ -1,64 +1,193 @@
 """I/O utilities for output formatting, pagination, and data parsing."""
 
+import csv
+import functools
 import json
+import re
 import sys
-from collections.abc import Callable
-from datetime import datetime
+from collections.abc import Callable, Collection, Sequence
+from concurrent.futures import ThreadPoolExecutor
+from datetime import UTC, datetime, timedelta, timezone
+from operator import itemgetter
 from typing import Any
+from urllib.parse import parse_qsl
 
 from rich import box
 from rich.console import Console
 from rich.table import Table
 
+try:
+    import ciso8601
+except ImportError:  # pragma: no cover - optional speedup
+    ciso8601 = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import orjson
+
+    _ORJSON_OPTIONS = orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+    _ORJSON_LINE_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_APPEND_NEWLINE
+except ImportError:  # pragma: no cover - optional speedup
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
 console = Console()
+error_console = Console(stderr=True)
+
+# Rows per Rich table when streaming large result sets
+TABLE_CHUNK_SIZE = 500
 
 
-def output_json(data: Any, fields: list[str] | None = None) -> None:
+def output_json(data: Any, fields: Collection[str] | None = None, *, jsonl: bool = False) -> None:
     """Output data as JSON.
 
     Args:
         data: Data to output (dict, list, or primitive)
         fields: Optional field filter (for dicts/lists of dicts)
+        jsonl: Write one compact JSON document per line (one per list item)
+            instead of a single indented document
     """
     if fields and isinstance(data, list | dict):
         data = filter_fields(data, fields)
 
-    console.print_json(json.dumps(data, indent=2, default=str))
+    if jsonl:
+        _output_json_lines(data if isinstance(data, list) else [data])
+        return
 
+    # Highlighting is invisible when piped; serialize straight to stdout
+    # instead of building a string for Rich to re-parse.
+    if not console.is_terminal:
+        if orjson is not None:
+            _write_bytes(orjson.dumps(data, default=str, option=_ORJSON_OPTIONS))
+        else:
+            json.dump(data, sys.stdout, indent=2, default=str, ensure_ascii=False)
+            sys.stdout.write("\n")
+        return
 
-def output_table(data: list[dict[str, Any]], fields: list[str] | None = None) -> None:
+    if orjson is not None:
+        text = orjson.dumps(data, default=str, option=_ORJSON_OPTIONS).decode()
+    else:
+        text = json.dumps(data, indent=2, default=str)
+    console.print_json(text)
+
+
+def _output_json_lines(rows: list[Any]) -> None:
+    """Write each item as a compact JSON line, serializing one record at a time.
+
+    Output starts with the first record and no document for the whole list is
+    ever built, so line-oriented tools (jq, grep) can consume it incrementally.
+    """
+    buffer = getattr(sys.stdout, "buffer", None)
+    if orjson is not None and buffer is not None:
+        # Keep ordering with anything already written through the text wrapper
+        sys.stdout.flush()
+        write_bytes = buffer.write
+        for row in rows:
+            write_bytes(orjson.dumps(row, default=str, option=_ORJSON_LINE_OPTIONS))
+        return
+
+    encode = json.JSONEncoder(default=str, ensure_ascii=False, separators=(",", ":")).encode
+    write = sys.stdout.write
+    for row in rows:
+        write(encode(row))
+        write("\n")
+
+
+def _write_bytes(*chunks: bytes | bytearray) -> None:
+    """Write encoded output to stdout, bypassing the text layer when possible."""
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is None:
+        for chunk in chunks:
+            sys.stdout.write(chunk.decode(errors="replace"))
+        return
+    # Keep ordering with anything already written through the text wrapper
+    sys.stdout.flush()
+    for chunk in chunks:
+        buffer.write(chunk)
+
+
+def output_table(
+    data: list[dict[str, Any]], fields: Sequence[str] | None = None, stream: bool = False
+) -> None:
     """Output data as a formatted table.
 
     Args:
         data: List of dicts to display
         fields: Optional field filter
+        stream: Print in chunks of TABLE_CHUNK_SIZE rows so output starts
+            immediately and only one chunk is measured at a time
+
+    When stdout is not a terminal, rows are written as tab-separated values
+    instead of a Rich table.
     """
     if not data:
         console.print("[dim]No results[/dim]")
         return
 
-    # Filter fields if specified
-    if fields:
-        data = [filter_fields(row, fields) for row in data]
-    else:
-        # Default: use all keys from first row
-        fields = list(data[0].keys())
+    # Only the requested columns are read below, so rows need no pre-filtering.
+    # Default: use all keys from first row
+    columns = tuple(fields) if fields else tuple(data[0].keys())
+
+    # Piped output gets plain tab-separated rows; Rich layout is wasted there
+    if not console.is_terminal:
+        writer = csv.writer(sys.stdout, delimiter="\t", lineterminator="\n")
+        writer.writerow(columns)
+        writer.writerows([_cell(row.get(field)) for field in columns] for row in data)
+        return
+
+    chunk_size = TABLE_CHUNK_SIZE if stream else len(data)
+    for start in range(0, len(data), chunk_size):
+        # Create table (header only on the first chunk)
+        table = Table(box=box.SIMPLE, show_header=start == 0)
+
+        for field in columns:
+            table.add_column(field, overflow="fold")
 
-    # Create table
-    table = Table(box=box.SIMPLE, show_header=True)
+        add_row = table.add_row
+        for row in data[start : start + chunk_size]:
+            get = row.get
+            add_row(*[_cell(get(field)) for field in columns])
 
-    for field in fields:
-        table.add_column(field, overflow="fold")
+        console.print(table)
 
-    for row in data:
-        table.add_row(*[str(row.get(field, "")) for field in fields])
 
-    console.print(table)
+def _cell(value: Any) -> str:
+    """Render a table cell identically for Rich tables and piped TSV (None is empty)."""
+    return "" if value is None else str(value)
 
 
 def output_raw(data: Any) -> None:
-    """Output data as raw string (no formatting)."""
-    print(data)
+    """Output data as raw string (no formatting).
+
+    Bytes are written to stdout unchanged; anything else is written as
+    ``str(data)`` in a single call.
+    """
+    if isinstance(data, bytes | bytearray):
+        _write_bytes(data, b"\n")
+        return
+    sys.stdout.write(f"{data}\n")
+
+
+_PAGINATION_METADATA_KEYS = frozenset({"offset", "limit", "size", "_links"})
+
+# Known paginated response keys, in lookup priority order
+_PAGINATED_KEYS = (
+    "projects",
+    "cases",
+    "runs",
+    "plans",
+    "tests",
+    "results",
+    "milestones",
+    "sections",
+    "suites",
+    "users",
+    "statuses",
+    "priorities",
+    "case_types",
+    "case_fields",
+    "result_fields",
+    "attachments",
+)
+_PAGINATED_KEY_SET = frozenset(_PAGINATED_KEYS)
 
 
 def extract_paginated_data(data: Any) -> Any:
@@ -85,115 +214,170 @@ def extract_paginated_data(data: Any) -> Any:
         return data
 
     # Check if response has pagination metadata
-    has_pagination_metadata = all(k in data for k in ["offset", "limit", "size"])
-
-    if has_pagination_metadata:
+    if "size" in data and "offset" in data and "limit" in data:
         # Find the array key (should be the one that's not metadata)
-        metadata_keys = {"offset", "limit", "size", "_links"}
         for key, value in data.items():
-            if key not in metadata_keys and isinstance(value, list):
+            if key not in _PAGINATION_METADATA_KEYS and isinstance(value, list):
                 return value
 
-    # Fallback: check known paginated response keys
-    paginated_keys = [
-        "projects",
-        "cases",
-        "runs",
-        "plans",
-        "tests",
-        "results",
-        "milestones",
-        "sections",
-        "suites",
-        "users",
-        "statuses",
-        "priorities",
-        "case_types",
-        "case_fields",
-        "result_fields",
-        "attachments",
-    ]
-
-    for key in paginated_keys:
-        if key in data:
-            return data[key]
+    # Fallback: check known paginated response keys (single-object
+    # responses usually share none, which isdisjoint decides in C)
+    if not _PAGINATED_KEY_SET.isdisjoint(data):
+        for key in _PAGINATED_KEYS:
+            if key in data:
+                return data[key]
 
     return data
 
 
-def output_result(data: Any, format: str = "json", fields: str | None = None) -> None:
+def output_result(
+    data: Any, format: str = "json", fields: str | None = None, stream: bool = False
+) -> None:
     """Output result in specified format.
 
     Args:
         data: Data to output
-        format: Output format (json, table, raw)
+        format: Output format (json, jsonl, table, raw)
         fields: Comma-separated field list
+        stream: Render tables in chunks (table format only)
     """
-    field_list = fields.split(",") if fields else None
+    columns, field_set = _parse_fields(fields) if fields else ((), frozenset())
 
     # Extract paginated data if needed (for table/fields filtering)
-    if format == "table" or field_list:
+    if format in ("table", "jsonl") or field_set:
         data = extract_paginated_data(data)
 
     if format == "json":
-        output_json(data, field_list)
+        output_json(data, field_set)
+    elif format == "jsonl":
+        output_json(data, field_set, jsonl=True)
     elif format == "table":
         if isinstance(data, list):
-            output_table(data, field_list)
+            output_table(data, columns, stream)
         else:
-            output_table([data], field_list)
+            output_table([data], columns, stream)
     elif format == "raw":
         output_raw(data)
     else:
         raise ValueError(f"Unknown output format: {format}")
 
 
-def filter_fields(data: Any, fields: list[str]) -> Any:
+@functools.lru_cache(maxsize=32)
+def _parse_fields(fields: str) -> tuple[tuple[str, ...], frozenset[str]]:
+    """Split a --fields value into ordered columns and a lookup set.
+
+    Cached so batch commands that output per item parse the flag once.
+    """
+    columns = tuple(parse_list(fields))
+    return columns, frozenset(columns)
+
+
+def filter_fields(data: Any, fields: Collection[str]) -> Any:
     """Filter data to include only specified fields.
 
     Args:
         data: Dict or list of dicts
-        fields: List of field names to include
+        fields: Field names to include (sets are used as-is, anything else is
+            converted once so key checks are hash lookups)
 
     Returns:
-        Filtered data
+        Filtered data; ``data`` itself, uncopied, when ``fields`` is empty
     """
     if not fields:
         return data
 
+    wanted = fields if isinstance(fields, set | frozenset) else frozenset(fields)
+
     if isinstance(data, dict):
-        return {k: v for k, v in data.items() if k in fields}
+        return {k: v for k, v in data.items() if k in wanted}
     elif isinstance(data, list):
-        return [filter_fields(item, fields) if isinstance(item, dict) else item for item in data]
+        return _filter_rows(data, wanted)
     else:
         return data
 
 
+def _filter_rows(rows: list[Any], wanted: set[str] | frozenset[str]) -> list[Any]:
+    """Filter a list of dicts, pulling values with one itemgetter when rows share keys.
+
+    TestRail list payloads are homogeneous, so the requested keys found in the
+    first dict are looked up in C for every row. Rows missing any of them (or
+    lists where the first dict lacks some requested key) take the generic path.
+    """
+    first = next((item for item in rows if isinstance(item, dict)), None)
+    if first is None:
+        return rows
+    present = tuple(k for k in first if k in wanted)
+    if len(present) != len(wanted):
+        return [
+            {k: v for k, v in item.items() if k in wanted} if isinstance(item, dict) else item
+            for item in rows
+        ]
+
+    getter = itemgetter(*present)
+    single = len(present) == 1
+    filtered: list[Any] = []
+    append = filtered.append
+    for item in rows:
+        if not isinstance(item, dict):
+            append(item)
+            continue
+        try:
+            values = getter(item)
+        except KeyError:
+            append({k: v for k, v in item.items() if k in wanted})
+            continue
+        append(dict(zip(present, (values,) if single else values, strict=True)))
+    return filtered
+
+
 def paginate_all(
-    fetch_func: Callable, limit: int = 250, offset: int = 0, **kwargs: Any
+    fetch_func: Callable,
+    limit: int = 250,
+    offset: int = 0,
+    max_workers: int = 1,
+    **kwargs: Any,
 ) -> list[dict[str, Any]]:
-    """Paginate through all results using limit/offset.
+    """Paginate through all results.
+
+    Responses carrying TestRail's ``_links`` block are followed via
+    ``_links.next`` until it is null. Endpoints that return bare lists fall
+    back to limit/offset stepping until a short page is returned.
 
     Args:
         fetch_func: Function that accepts offset, limit, and kwargs
         limit: Page size
         offset: Starting offset
+        max_workers: Pages to request concurrently (1 fetches sequentially)
         **kwargs: Additional parameters to pass to fetch_func
 
     Returns:
         List of all results
     """
-    all_results = []
+    if max_workers > 1:
+        return _paginate_concurrent(fetch_func, limit, offset, max_workers, kwargs)
+
+    # TestRail's "size" is the item count of the current page, not a total,
+    # so the final length is unknown and the list cannot be pre-sized.
+    all_results: list[dict[str, Any]] = []
     current_offset = offset
 
     while True:
-        results = fetch_func(offset=current_offset, limit=limit, **kwargs)
+        response = fetch_func(offset=current_offset, limit=limit, **kwargs)
+        results = extract_paginated_data(response)
 
         if not results:
             break
 
         all_results.extend(results)
 
+        if isinstance(response, dict) and "_links" in response:
+            next_page = _next_page_params(response)
+            if next_page is None:
+                break
+            current_offset = next_page.get("offset", current_offset + len(results))
+            limit = next_page.get("limit", limit)
+            continue
+
         if len(results) < limit:
             break
 
@@ -202,10 +386,106 @@ def paginate_all(
     return all_results
 
 
+def _paginate_concurrent(
+    fetch_func: Callable,
+    limit: int,
+    offset: int,
+    max_workers: int,
+    kwargs: dict[str, Any],
+) -> list[dict[str, Any]]:
+    """Fetch pages in windows of ``max_workers`` concurrent requests.
+
+    TestRail does not report a total count, so each window speculatively
+    requests the next ``max_workers`` offsets and stops at the first short
+    or empty page. Results are kept in offset order.
+    """
+    all_results: list[dict[str, Any]] = []
+    window_offset = offset
+
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        while True:
+            futures = [
+                pool.submit(fetch_func, offset=window_offset + i * limit, limit=limit, **kwargs)
+                for i in range(max_workers)
+            ]
+            for future in futures:
+                results = extract_paginated_data(future.result())
+                if results:
+                    all_results.extend(results)
+                if not results or len(results) < limit:
+                    for pending in futures:
+                        pending.cancel()
+                    return all_results
+
+            window_offset += max_workers * limit
+
+
+def _next_page_params(response: dict[str, Any]) -> dict[str, int] | None:
+    """Read offset/limit from a ``_links.next`` URL, or None on the last page.
+
+    TestRail links look like ``/api/v2/get_cases/1&limit=250&offset=250``.
+    """
+    links = response.get("_links") or {}
+    next_link = links.get("next") if isinstance(links, dict) else None
+    if not next_link:
+        return None
+
+    _, _, query = str(next_link).partition("&")
+    params: dict[str, int] = {}
+    for key, value in parse_qsl(query):
+        if key in ("offset", "limit") and value.isdecimal():
+            params[key] = int(value)
+    return params
+
+
+# Common full timestamp shape; anything else goes through fromisoformat
+_ISO_DATETIME_RE = re.compile(
+    r"(\d{4})-(\d{2})-(\d{2})[T ](\d{2}):(\d{2}):(\d{2})(?:\.(\d{1,6})\d*)?"
+    r"(Z|[+-]\d{2}:?\d{2})?",
+    re.ASCII,
+)
+
+
+def _fast_parse(value: str) -> datetime:
+    """Parse an ISO8601 string, using ciso8601 when it is installed."""
+    if ciso8601 is not None:
+        parsed: datetime = ciso8601.parse_datetime(value)
+        return parsed
+
+    match = _ISO_DATETIME_RE.fullmatch(value)
+    if match is None:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+    fraction = match.group(7)
+    offset = match.group(8)
+    tzinfo = None
+    if offset == "Z":
+        tzinfo = UTC
+    elif offset:
+        if int(offset[-2:]) >= 60:
+            raise ValueError(f"Invalid UTC offset: {offset}")
+        minutes = int(offset[1:3]) * 60 + int(offset[-2:])
+        tzinfo = timezone(timedelta(minutes=-minutes if offset[0] == "-" else minutes))
+
+    return datetime(
+        int(match.group(1)),
+        int(match.group(2)),
+        int(match.group(3)),
+        int(match.group(4)),
+        int(match.group(5)),
+        int(match.group(6)),
+        int(fraction.ljust(6, "0")) if fraction else 0,
+        tzinfo=tzinfo,
+    )
+
+
+@functools.lru_cache(maxsize=1024)
 def parse_datetime(value: str) -> int:
     """Parse datetime string to epoch seconds.
 
-    Accepts ISO8601 format or epoch seconds.
+    Accepts ISO8601 format or epoch seconds. Results are memoized since the
+    same filter values are commonly parsed repeatedly; invalid input raises
+    and is never cached.
 
     Args:
         value: DateTime string or epoch seconds
@@ -213,35 +493,32 @@ def parse_datetime(value: str) -> int:
     Returns:
         Unix timestamp (seconds since epoch)
     """
-    # Try as epoch seconds first
-    try:
-        timestamp = int(value)
+    # Epoch seconds: cheap digit check instead of a failing int() on ISO input
+    text = value.strip()
+    digits = text[1:] if text[:1] in ("-", "+") else text
+    if digits.isdecimal():
+        timestamp = int(text)
         # Validate reasonable range (1970-2100)
         if timestamp < 0 or timestamp > 4102444800:
             raise ValueError(
                 f"Invalid timestamp: {value}. Must be between 0 and 4102444800 (year 2100)."
             )
         return timestamp
-    except ValueError as e:
-        if "Invalid timestamp" in str(e):
-            raise
-        # Not an integer, try ISO8601
 
     # Try ISO8601 parsing
     try:
-        dt = datetime.fromisoformat(value.replace("Z", "+00:00"))
-        timestamp = int(dt.timestamp())
-        # Validate reasonable range
-        if timestamp < 0 or timestamp > 4102444800:
-            raise ValueError(f"Invalid date: {value}. Must be between 1970 and 2100.")
-        return timestamp
+        dt = _fast_parse(value)
     except ValueError as e:
-        if "Invalid date" in str(e):
-            raise
         raise ValueError(
             f"Invalid datetime format: {value}. Use ISO8601 (e.g., '2024-01-01T00:00:00Z') or epoch seconds."
         ) from e
 
+    timestamp = int(dt.timestamp())
+    # Validate reasonable range
+    if timestamp < 0 or timestamp > 4102444800:
+        raise ValueError(f"Invalid date: {value}. Must be between 1970 and 2100.")
+    return timestamp
+
 
 def parse_list(value: str) -> list[str]:
     """Parse comma-separated string to list.
@@ -252,7 +529,10 @@ def parse_list(value: str) -> list[str]:
     Returns:
         List of strings
     """
-    return [v.strip() for v in value.split(",") if v.strip()]
+    if "," not in value:
+        single = value.strip()
+        return [single] if single else []
+    return list(filter(None, map(str.strip, value.split(","))))
 
 
 def error_exit(message: str, exit_code: int = 1) -> None:
@@ -262,7 +542,6 @@ def error_exit(message: str, exit_code: int = 1) -> None:
         message: Error message
         exit_code: Exit code (default 1)
     """
-    error_console = Console(stderr=True)
     error_console.print(f"[bold red]Error:[/bold red] {message}")
     sys.exit(exit_code)
 
@@ -281,9 +560,13 @@ def handle_api_error(e: Exception) -> None:
         # Try to parse error body
         if body:
             try:
-                body_str = body.decode("utf-8") if isinstance(body, bytes) else str(body)
-                error_data = json.loads(body_str)
-                if "error" in error_data:
+                if orjson is not None and isinstance(body, bytes | bytearray):
+                    # orjson parses the raw bytes without a decode step
+                    error_data = orjson.loads(body)
+                else:
+                    body_str = body.decode("utf-8") if isinstance(body, bytes) else str(body)
+                    error_data = json.loads(body_str)
+                if isinstance(error_data, dict) and "error" in error_data:
                     error_msg = f"HTTP {status_code}: {error_data['error']}"
             except (ValueError, AttributeError):
                 pass
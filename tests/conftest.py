@@ -1,17 +1,16 @@
 """Shared test fixtures and configuration."""
 
-from unittest.mock import MagicMock
-
 import pytest
 
 
-@pytest.fixture
-def mock_testrail_client():
-    """Create a mock TestRail API client."""
-    client = MagicMock()
-    client.base_url = "https://example.testrail.io"
-    client.user = "test@example.com"
-    return client
+def pytest_addoption(parser):
+    """Register command-line options for the test suite."""
+    parser.addoption(
+        "--record-mocks",
+        action="store_true",
+        default=False,
+        help="Forward replay-client reads to a live TestRail instance and update the tapes",
+    )
 
 
 @pytest.fixture
@@ -0,0 +1,269 @@
+"""Parameter tables for test_commands_crud, keyed by resource module.
+
+Each row is (argv, method, return_value, call, expected_output): the CLI args,
+the client method they should hit, its canned return value, the expected
+(args, kwargs) of the single call and an optional stdout substring.
+"""
+
+import pytest
+
+CRUD_ARGNAMES = ("argv", "method", "return_value", "call", "expected_output")
+
+CRUD_TABLES = {
+    "plans": [
+        pytest.param(
+            ["list", "--project-id", "1"],
+            "get_plans",
+            [{"id": 1, "name": "Plan 1"}],
+            ((1,), {}),
+            "Plan 1",
+            id="list",
+        ),
+        pytest.param(
+            [
+                "list",
+                "--project-id",
+                "1",
+                "--created-after",
+                "1600000000",
+                "--is-completed",
+                "1",
+                "--limit",
+                "5",
+            ],
+            "get_plans",
+            [],
+            ((1,), {"created_after": 1600000000, "is_completed": 1, "limit": 5}),
+            None,
+            id="list-filters",
+        ),
+        pytest.param(
+            ["get", "1"],
+            "get_plan",
+            {"id": 1, "name": "Plan 1"},
+            ((1,), {}),
+            "Plan 1",
+            id="get",
+        ),
+        pytest.param(
+            ["add", "--project-id", "1", "--name", "New Plan"],
+            "add_plan",
+            {"id": 1, "name": "New Plan"},
+            ((1, "New Plan"), {}),
+            "New Plan",
+            id="add",
+        ),
+        pytest.param(
+            [
+                "add",
+                "--project-id",
+                "1",
+                "--name",
+                "New Plan",
+                "--description",
+                "Desc",
+                "--milestone-id",
+                "2",
+            ],
+            "add_plan",
+            {"id": 1, "name": "New Plan"},
+            ((1, "New Plan"), {"description": "Desc", "milestone_id": "2"}),
+            None,
+            id="add-optional-args",
+        ),
+        pytest.param(
+            ["update", "1", "--name", "Updated Plan"],
+            "update_plan",
+            {"id": 1, "name": "Updated Plan"},
+            ((1,), {"name": "Updated Plan"}),
+            "Updated Plan",
+            id="update",
+        ),
+        pytest.param(
+            ["close", "1"],
+            "close_plan",
+            {"id": 1, "is_completed": True},
+            ((1,), {}),
+            None,
+            id="close",
+        ),
+        pytest.param(
+            ["delete", "1", "--yes"],
+            "delete_plan",
+            None,
+            ((1,), {}),
+            "deleted successfully",
+            id="delete",
+        ),
+    ],
+    "projects": [
+        pytest.param(
+            ["list", "--is-completed", "0"],
+            "get_projects",
+            [{"id": 1, "name": "Project 1"}],
+            ((), {"is_completed": 0}),
+            "Project 1",
+            id="list",
+        ),
+        pytest.param(
+            ["get", "1"],
+            "get_project",
+            {"id": 1, "name": "Project 1"},
+            ((1,), {}),
+            "Project 1",
+            id="get",
+        ),
+        pytest.param(
+            ["add", "--name", "New Project", "--announcement", "Announce"],
+            "add_project",
+            {"id": 1, "name": "New Project"},
+            (("New Project",), {"announcement": "Announce"}),
+            "New Project",
+            id="add",
+        ),
+        pytest.param(
+            ["update", "1", "--name", "Updated Project"],
+            "update_project",
+            {"id": 1, "name": "Updated Project"},
+            ((1,), {"name": "Updated Project"}),
+            "Updated Project",
+            id="update",
+        ),
+    ],
+    "runs": [
+        pytest.param(
+            ["list", "--project-id", "1", "--limit", "10"],
+            "get_runs",
+            [{"id": 1, "name": "Test Run"}],
+            ((1,), {"limit": "10"}),
+            "Test Run",
+            id="list",
+        ),
+        pytest.param(
+            ["get", "1"],
+            "get_run",
+            {"id": 1, "name": "Test Run"},
+            ((1,), {}),
+            "Test Run",
+            id="get",
+        ),
+        pytest.param(
+            ["add", "--project-id", "1", "--name", "New Run", "--description", "Desc"],
+            "add_run",
+            {"id": 1, "name": "New Run"},
+            ((1,), {"name": "New Run", "description": "Desc"}),
+            "New Run",
+            id="add",
+        ),
+        pytest.param(
+            ["update", "1", "--name", "Updated Run"],
+            "update_run",
+            {"id": 1, "name": "Updated Run"},
+            ((1,), {"name": "Updated Run"}),
+            "Updated Run",
+            id="update",
+        ),
+        pytest.param(
+            ["close", "1"],
+            "close_run",
+            {"id": 1, "is_completed": True},
+            ((1,), {}),
+            None,
+            id="close",
+        ),
+    ],
+    "suites": [
+        pytest.param(
+            ["list", "--project-id", "1"],
+            "get_suites",
+            [{"id": 1, "name": "Suite 1"}],
+            ((1,), {}),
+            "Suite 1",
+            id="list",
+        ),
+        pytest.param(
+            ["get", "1"],
+            "get_suite",
+            {"id": 1, "name": "Suite 1"},
+            ((1,), {}),
+            "Suite 1",
+            id="get",
+        ),
+        pytest.param(
+            ["add", "--project-id", "1", "--name", "New Suite"],
+            "add_suite",
+            {"id": 1, "name": "New Suite"},
+            ((1, "New Suite"), {}),
+            "New Suite",
+            id="add",
+        ),
+        pytest.param(
+            ["add", "--project-id", "1", "--name", "New Suite", "--description", "Desc"],
+            "add_suite",
+            {"id": 1, "name": "New Suite"},
+            ((1, "New Suite"), {"description": "Desc"}),
+            None,
+            id="add-description",
+        ),
+        pytest.param(
+            ["update", "1", "--name", "Updated Suite"],
+            "update_suite",
+            {"id": 1, "name": "Updated Suite"},
+            ((1,), {"name": "Updated Suite"}),
+            "Updated Suite",
+            id="update",
+        ),
+        pytest.param(
+            ["delete", "1", "--yes"],
+            "delete_suite",
+            None,
+            ((1,), {}),
+            "deleted successfully",
+            id="delete",
+        ),
+    ],
+    "results": [
+        pytest.param(
+            ["list", "--test-id", "1", "--limit", "10"],
+            "get_results",
+            [{"id": 1, "status_id": 1}],
+            ((1,), {"limit": "10"}),
+            None,
+            id="list",
+        ),
+        pytest.param(
+            ["list-for-case", "--run-id", "1", "--case-id", "2", "--limit", "10"],
+            "get_results_for_case",
+            [{"id": 1, "status_id": 1}],
+            ((1, 2), {"limit": "10"}),
+            None,
+            id="list-for-case",
+        ),
+        pytest.param(
+            ["add", "--test-id", "1", "--status-id", "1", "--comment", "Test comment"],
+            "add_result",
+            {"id": 1, "status_id": 1},
+            ((1,), {"status_id": "1", "comment": "Test comment"}),
+            None,
+            id="add",
+        ),
+        pytest.param(
+            [
+                "add-for-case",
+                "--run-id",
+                "1",
+                "--case-id",
+                "2",
+                "--status-id",
+                "1",
+                "--comment",
+                "Test comment",
+            ],
+            "add_result_for_case",
+            {"id": 1, "status_id": 1},
+            ((1, 2), {"status_id": "1", "comment": "Test comment"}),
+            None,
+            id="add-for-case",
+        ),
+    ],
+}
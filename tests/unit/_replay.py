@@ -0,0 +1,74 @@
+"""Record-and-replay stand-in for TestRailClient backed by a JSON tape."""
+
+import copy
+import json
+from pathlib import Path
+from typing import Any
+
+from testrail_cli.client import TestRailClient
+
+from ._stub import CallRecorder
+
+
+def _tape_key(name: str, args: list[Any] | tuple[Any, ...], kwargs: dict[str, Any]) -> str:
+    """Key an interaction on the method and the ids it addresses, not its payload."""
+    ids = {k: v for k, v in kwargs.items() if k.endswith("_id")}
+    return json.dumps([name, list(args), ids], sort_keys=True, default=str)
+
+
+class ReplayClient(CallRecorder):
+    """Answer read calls from responses recorded against a real TestRail instance.
+
+    Every call is recorded exactly like CallRecorder. Only ``get_*`` reads are
+    taped: in replay mode a read missing from the tape fails loudly; with
+    ``live`` set, reads are forwarded to that client and captured for ``save``.
+    Writes are never sent anywhere and return ``returns[name]`` as CallRecorder
+    does, so recording cannot create or modify data on the live instance.
+    """
+
+    def __init__(self, tape_path: Path, live: TestRailClient | None = None) -> None:
+        super().__init__()
+        self.tape_path = tape_path
+        self.live = live
+        self.tape: dict[str, Any] = {}
+        if tape_path.exists():
+            for entry in json.loads(tape_path.read_text()):
+                self.tape[_tape_key(entry["method"], entry["args"], entry["kwargs"])] = entry[
+                    "response"
+                ]
+        self._recorded: list[dict[str, Any]] = []
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or not hasattr(TestRailClient, name):
+            raise AttributeError(name)
+        if not name.startswith("get_"):
+            return super().__getattr__(name)
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            self.calls.setdefault(name, []).append((args, kwargs))
+            key = _tape_key(name, args, kwargs)
+            if self.live is not None:
+                response = getattr(self.live, name)(*args, **kwargs)
+                self.tape[key] = response
+                self._recorded.append(
+                    {"method": name, "args": list(args), "kwargs": kwargs, "response": response}
+                )
+            elif key not in self.tape:
+                raise KeyError(f"No recorded response for {key}; re-run with --record-mocks")
+            return copy.deepcopy(self.tape[key])
+
+        return method
+
+    def save(self) -> None:
+        """Merge reads captured in this session into the tape file."""
+        if not self._recorded:
+            return
+        entries = json.loads(self.tape_path.read_text()) if self.tape_path.exists() else []
+        keys = {_tape_key(e["method"], e["args"], e["kwargs"]) for e in entries}
+        for entry in self._recorded:
+            key = _tape_key(entry["method"], entry["args"], entry["kwargs"])
+            if key not in keys:
+                keys.add(key)
+                entries.append(entry)
+        self.tape_path.parent.mkdir(parents=True, exist_ok=True)
+        self.tape_path.write_text(json.dumps(entries, indent=2, default=str) + "\n")
@@ -0,0 +1,73 @@
+"""Lightweight stand-ins for TestRailClient."""
+
+from typing import Any
+
+from testrail_cli.client import TestRailClient
+
+
+class CallRecorder:
+    """Record client method calls and serve canned return values.
+
+    Much cheaper to build than a spec'd MagicMock. Only names defined on
+    TestRailClient resolve, so typos still fail loudly.
+    """
+
+    def __init__(self) -> None:
+        self.calls: dict[str, list[tuple[tuple[Any, ...], dict[str, Any]]]] = {}
+        self.returns: dict[str, Any] = {}
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("_") or not hasattr(TestRailClient, name):
+            raise AttributeError(name)
+
+        def method(*args: Any, **kwargs: Any) -> Any:
+            self.calls.setdefault(name, []).append((args, kwargs))
+            return self.returns.get(name)
+
+        return method
+
+
+class StubTestRailClient:
+    """Lightweight stub client for CSV import tests."""
+
+    __slots__ = ("created_cases", "updated_cases", "sections", "cases_for_export")
+
+    def __init__(self):
+        self.created_cases: list[dict] = []
+        self.updated_cases: list[dict] = []
+        self.sections = {10: {"id": 10, "name": "Auth", "parent_id": None}}
+        self.cases_for_export: list[dict] = []
+
+    def get_suites(self, _project_id: int):
+        return [{"id": 1, "name": "Default"}]
+
+    def get_sections(self, _project_id: int, suite_id: int | None = None):
+        _ = suite_id
+        return list(self.sections.values())
+
+    def get_section(self, section_id: int):
+        return self.sections[section_id]
+
+    def add_section(self, _project_id: int, name: str, **kwargs):
+        # Mirrors TestRail structure
+        return {"id": 99, "name": name, **kwargs}
+
+    def add_case(self, section_id: int, title: str, **kwargs):
+        payload = {"section_id": section_id, "title": title, **kwargs}
+        self.created_cases.append(payload)
+        return {"id": len(self.created_cases), **payload}
+
+    def update_case(self, case_id: int, **kwargs):
+        payload = {"case_id": case_id, **kwargs}
+        self.updated_cases.append(payload)
+        return payload
+
+    def get_cases(self, _project_id: int, **kwargs):
+        _ = kwargs
+        return self.cases_for_export
+
+    def get_case(self, case_id: int):
+        for case in self.cases_for_export:
+            if case["id"] == case_id:
+                return case
+        raise KeyError(case_id)
@@ -0,0 +1,108 @@
+"""Shared fixtures for unit tests."""
+
+from pathlib import Path
+from unittest.mock import create_autospec
+
+import click
+import pytest
+import typer
+from typer.testing import CliRunner
+
+from testrail_cli import config
+from testrail_cli.client import TestRailClient
+
+from ._replay import ReplayClient
+from ._stub import CallRecorder, StubTestRailClient
+
+
+@pytest.fixture(scope="session")
+def cli_runner():
+    """Provide a CliRunner shared across the session (stderr is captured separately)."""
+    return CliRunner()
+
+
+@pytest.fixture(scope="session")
+def invoke_command():
+    """Call a subcommand's callback directly with already-typed parameters.
+
+    Skips argv tokenization, option parsing and output capture; use it for tests
+    that only assert on client calls. Omitted parameters take their declared defaults.
+    """
+    groups: dict[int, click.Group] = {}
+
+    def invoke(app, command_name, client, /, **params):
+        group = groups.get(id(app))
+        if group is None:
+            group = groups[id(app)] = typer.main.get_group(app)
+        command = group.commands[command_name]
+        with click.Context(command, obj={"client": client}) as ctx:
+            return ctx.invoke(command, **params)
+
+    return invoke
+
+
+@pytest.fixture(scope="session")
+def _client_spec():
+    """Build the autospecced TestRailClient once; introspection is the costly part."""
+    return create_autospec(TestRailClient, instance=True)
+
+
+@pytest.fixture
+def mock_client(_client_spec):
+    """Provide the shared TestRailClient mock with calls and return values cleared."""
+    _client_spec.reset_mock(return_value=True, side_effect=True)
+    return _client_spec
+
+
+@pytest.fixture
+def stub_client():
+    """Provide a fresh call-recording client stub."""
+    return CallRecorder()
+
+
+@pytest.fixture
+def stub_testrail_client():
+    """Provide a fresh in-memory TestRail stub with one "Auth" section."""
+    return StubTestRailClient()
+
+
+@pytest.fixture
+def isolated_home(tmp_path, monkeypatch):
+    """Run the test with tmp_path as both working and home directory."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(Path, "home", lambda: tmp_path)
+    return tmp_path
+
+
+@pytest.fixture(scope="session")
+def sample_config_file(tmp_path_factory):
+    """Write a sample config file once per session; tests must not modify it."""
+    path = tmp_path_factory.mktemp("config") / "test-config.yaml"
+    path.write_text("profiles:\n  default:\n    url: https://test.testrail.io\n")
+    path.chmod(0o600)
+    return path
+
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+@pytest.fixture
+def replay_client(request):
+    """Build ReplayClients over tapes in tests/fixtures.
+
+    With --record-mocks, read calls go to the TestRail instance from the usual
+    config resolution and new responses are written back to the tape. Writes
+    are only recorded locally and never reach that instance.
+    """
+    record = request.config.getoption("--record-mocks")
+    clients: list[ReplayClient] = []
+
+    def make(tape_name):
+        live = TestRailClient(**config.resolve_config()) if record else None
+        client = ReplayClient(FIXTURES_DIR / tape_name, live=live)
+        clients.append(client)
+        return client
+
+    yield make
+    for client in clients:
+        client.save()
@@ -1,22 +1,19 @@
 """Unit tests for cases commands."""
 
 import json
-from unittest.mock import MagicMock
 
-from typer.testing import CliRunner
+import pytest
 
-from testrail_cli.client import TestRailClient
 from testrail_cli.commands.cases import app
 
-runner = CliRunner()
+pytestmark = pytest.mark.unit
 
 
-def test_list_cases():
+def test_list_cases(cli_runner, mock_client):
     """Test listing cases."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.get_cases.return_value = [{"id": 1, "title": "Case 1"}]
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["list", "--project-id", "1"],
         obj={"client": mock_client},
@@ -29,15 +26,16 @@ def test_list_cases():
     assert "Case 1" in result.stdout
 
 
-def test_list_cases_by_ids():
+def test_list_cases_by_ids(cli_runner, mock_client):
     """Test listing cases by IDs."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.get_case.return_value = {"id": 1, "title": "Case 1"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["list", "--case-ids", "1,2"],
         obj={"client": mock_client},
+        catch_exceptions=False,
+        color=False,
     )
 
     assert result.exit_code == 0
@@ -46,30 +44,21 @@ def test_list_cases_by_ids():
     mock_client.get_case.assert_any_call(2)
 
 
-def test_list_cases_filters():
+def test_list_cases_filters(invoke_command, mock_client):
     """Test listing cases with filters."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.get_cases.return_value = []
 
-    result = runner.invoke(
+    invoke_command(
         app,
-        [
-            "list",
-            "--project-id",
-            "1",
-            "--suite-id",
-            "2",
-            "--section-id",
-            "3",
-            "--created-after",
-            "1600000000",
-            "--priority-id",
-            "1,2",
-        ],
-        obj={"client": mock_client},
+        "list",
+        mock_client,
+        project_id=1,
+        suite_id=2,
+        section_id=3,
+        created_after="1600000000",
+        priority_id="1,2",
     )
 
-    assert result.exit_code == 0
     mock_client.get_cases.assert_called_once()
     args, kwargs = mock_client.get_cases.call_args
     assert args == (1,)
@@ -79,12 +68,11 @@ def test_list_cases_filters():
     assert kwargs["priority_id"] == ["1", "2"]
 
 
-def test_get_case():
+def test_get_case(cli_runner, mock_client):
     """Test getting a specific case."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.get_case.return_value = {"id": 1, "title": "Case 1"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["get", "1"],
         obj={"client": mock_client},
@@ -95,12 +83,11 @@ def test_get_case():
     assert "Case 1" in result.stdout
 
 
-def test_add_case():
+def test_add_case(cli_runner, mock_client):
     """Test adding a case."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.add_case.return_value = {"id": 1, "title": "New Case"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["add", "--section-id", "1", "--title", "New Case"],
         obj={"client": mock_client},
@@ -111,34 +98,23 @@ def test_add_case():
     assert "New Case" in result.stdout
 
 
-def test_add_case_optional_args():
+def test_add_case_optional_args(invoke_command, mock_client):
     """Test adding a case with optional arguments."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.add_case.return_value = {"id": 1, "title": "New Case"}
 
-    result = runner.invoke(
+    invoke_command(
         app,
-        [
-            "add",
-            "--section-id",
-            "1",
-            "--title",
-            "New Case",
-            "--template-id",
-            "2",
-            "--type-id",
-            "3",
-            "--priority-id",
-            "4",
-            "--estimate",
-            "1h",
-            "--refs",
-            "REF-1",
-        ],
-        obj={"client": mock_client},
+        "add",
+        mock_client,
+        section_id=1,
+        title="New Case",
+        template_id=2,
+        type_id=3,
+        priority_id=4,
+        estimate="1h",
+        refs="REF-1",
     )
 
-    assert result.exit_code == 0
     mock_client.add_case.assert_called_once()
     args, kwargs = mock_client.add_case.call_args
     assert args == (1, "New Case")
@@ -149,12 +125,11 @@ def test_add_case_optional_args():
     assert kwargs["refs"] == "REF-1"
 
 
-def test_update_case():
+def test_update_case(cli_runner, mock_client):
     """Test updating a case."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.update_case.return_value = {"id": 1, "title": "Updated Case"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["update", "1", "--title", "Updated Case"],
         obj={"client": mock_client},
@@ -165,7 +140,7 @@ def test_update_case():
     assert "Updated Case" in result.stdout
 
 
-def test_update_case_json_file(tmp_path):
+def test_update_case_json_file(tmp_path, cli_runner, mock_client):
     """Test updating a case using a JSON file."""
     # Create a dummy JSON file
     json_file = tmp_path / "update.json"
@@ -176,14 +151,15 @@ def test_update_case_json_file(tmp_path):
     }
     json_file.write_text(json.dumps(update_data), encoding="utf-8")
 
-    # Mock the client
-    mock_client = MagicMock(spec=TestRailClient)
+    # Configure the client
     mock_client.update_case.return_value = {"id": 1, "title": "Updated via JSON"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["update", "1", "--json", str(json_file)],
         obj={"client": mock_client},
+        catch_exceptions=False,
+        color=False,
     )
 
     assert result.exit_code == 0
@@ -195,19 +171,20 @@ def test_update_case_json_file(tmp_path):
     assert call_args[1]["priority_id"] == 2
 
 
-def test_update_case_json_stdin():
+def test_update_case_json_stdin(cli_runner, mock_client):
     """Test updating a case using stdin."""
     update_data = {"title": "Updated via Stdin", "custom_steps": "Steps"}
     input_str = json.dumps(update_data)
 
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.update_case.return_value = {"id": 1, "title": "Updated via Stdin"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["update", "1", "--file", "-"],
         input=input_str,
         obj={"client": mock_client},
+        catch_exceptions=False,
+        color=False,
     )
 
     assert result.exit_code == 0
@@ -217,7 +194,7 @@ def test_update_case_json_stdin():
     assert call_args[1]["custom_steps"] == "Steps"
 
 
-def test_update_case_arg_priority():
+def test_update_case_arg_priority(cli_runner, mock_client):
     """Test that CLI args override JSON values."""
     import os
     import tempfile
@@ -227,13 +204,14 @@ def test_update_case_arg_priority():
         tmp_path = tmp.name
 
     try:
-        mock_client = MagicMock(spec=TestRailClient)
         mock_client.update_case.return_value = {"id": 1, "title": "From CLI"}
 
-        result = runner.invoke(
+        result = cli_runner.invoke(
             app,
             ["update", "1", "--json", tmp_path, "--title", "From CLI"],
             obj={"client": mock_client},
+            catch_exceptions=False,
+            color=False,
         )
 
         assert result.exit_code == 0
@@ -246,11 +224,10 @@ def test_update_case_arg_priority():
         os.remove(tmp_path)
 
 
-def test_delete_case():
+def test_delete_case(cli_runner, mock_client):
     """Test deleting a case."""
-    mock_client = MagicMock(spec=TestRailClient)
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["delete", "1", "--yes"],
         obj={"client": mock_client},
@@ -261,15 +238,8 @@ def test_delete_case():
     assert "deleted successfully" in result.stdout
 
 
-def test_delete_case_soft():
+def test_delete_case_soft(invoke_command, mock_client):
     """Test soft deleting a case."""
-    mock_client = MagicMock(spec=TestRailClient)
+    invoke_command(app, "delete", mock_client, case_id=1, soft=1, yes=True)
 
-    result = runner.invoke(
-        app,
-        ["delete", "1", "--soft", "1", "--yes"],
-        obj={"client": mock_client},
-    )
-
-    assert result.exit_code == 0
     mock_client.delete_case.assert_called_once_with(1, soft=1)
@@ -0,0 +1,30 @@
+"""Unit tests for the CRUD subcommands of each resource, driven by CRUD_TABLES."""
+
+import importlib
+
+import pytest
+
+from ._crud_tables import CRUD_ARGNAMES, CRUD_TABLES
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.mark.parametrize(
+    ("resource", *CRUD_ARGNAMES),
+    [
+        pytest.param(resource, *row.values, id=f"{resource}-{row.id}", marks=row.marks)
+        for resource, rows in CRUD_TABLES.items()
+        for row in rows
+    ],
+)
+def test_crud(cli_runner, stub_client, resource, argv, method, return_value, call, expected_output):
+    """Test each resource subcommand calls the matching client method."""
+    app = importlib.import_module(f"testrail_cli.commands.{resource}").app
+    stub_client.returns[method] = return_value
+
+    result = cli_runner.invoke(app, argv, obj={"client": stub_client})
+
+    assert result.exit_code == 0
+    assert stub_client.calls == {method: [call]}
+    if expected_output:
+        assert expected_output in result.stdout
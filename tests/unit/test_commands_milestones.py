@@ -1,21 +1,17 @@
 """Unit tests for milestones commands."""
 
-from unittest.mock import MagicMock
+import pytest
 
-from typer.testing import CliRunner
-
-from testrail_cli.client import TestRailClient
 from testrail_cli.commands.milestones import app
 
-runner = CliRunner()
+pytestmark = pytest.mark.unit
 
 
-def test_list_milestones():
+def test_list_milestones(cli_runner, mock_client):
     """Test listing milestones."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.get_milestones.return_value = [{"id": 1, "name": "Milestone 1"}]
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["list", "--project-id", "1"],
         obj={"client": mock_client},
@@ -26,27 +22,20 @@ def test_list_milestones():
     assert "Milestone 1" in result.stdout
 
 
-def test_list_milestones_completed_filter():
+def test_list_milestones_completed_filter(invoke_command, mock_client):
     """Test listing milestones with completed filter."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.get_milestones.return_value = []
 
-    result = runner.invoke(
-        app,
-        ["list", "--project-id", "1", "--is-completed", "1"],
-        obj={"client": mock_client},
-    )
+    invoke_command(app, "list", mock_client, project_id=1, is_completed=1)
 
-    assert result.exit_code == 0
     mock_client.get_milestones.assert_called_once_with(1, is_completed=1)
 
 
-def test_get_milestone():
+def test_get_milestone(cli_runner, mock_client):
     """Test getting a specific milestone."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.get_milestone.return_value = {"id": 1, "name": "Milestone 1"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["get", "1"],
         obj={"client": mock_client},
@@ -57,12 +46,11 @@ def test_get_milestone():
     assert "Milestone 1" in result.stdout
 
 
-def test_add_milestone():
+def test_add_milestone(cli_runner, mock_client):
     """Test adding a milestone."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.add_milestone.return_value = {"id": 1, "name": "New Milestone"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["add", "--project-id", "1", "--name", "New Milestone"],
         obj={"client": mock_client},
@@ -73,32 +61,22 @@ def test_add_milestone():
     assert "New Milestone" in result.stdout
 
 
-def test_add_milestone_optional_args():
+def test_add_milestone_optional_args(invoke_command, mock_client):
     """Test adding a milestone with optional arguments."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.add_milestone.return_value = {"id": 1, "name": "New Milestone"}
 
-    result = runner.invoke(
+    invoke_command(
         app,
-        [
-            "add",
-            "--project-id",
-            "1",
-            "--name",
-            "New Milestone",
-            "--description",
-            "Desc",
-            "--due-on",
-            "1600000000",
-            "--parent-id",
-            "2",
-            "--start-on",
-            "1500000000",
-        ],
-        obj={"client": mock_client},
+        "add",
+        mock_client,
+        project_id=1,
+        name="New Milestone",
+        description="Desc",
+        due_on="1600000000",
+        parent_id=2,
+        start_on="1500000000",
     )
 
-    assert result.exit_code == 0
     mock_client.add_milestone.assert_called_once()
     args, kwargs = mock_client.add_milestone.call_args
     assert args == (1, "New Milestone")
@@ -108,12 +86,11 @@ def test_add_milestone_optional_args():
     assert kwargs["start_on"] == "1500000000"
 
 
-def test_update_milestone():
+def test_update_milestone(cli_runner, mock_client):
     """Test updating a milestone."""
-    mock_client = MagicMock(spec=TestRailClient)
     mock_client.update_milestone.return_value = {"id": 1, "name": "Updated Milestone"}
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["update", "1", "--name", "Updated Milestone"],
         obj={"client": mock_client},
@@ -124,11 +101,10 @@ def test_update_milestone():
     assert "Updated Milestone" in result.stdout
 
 
-def test_delete_milestone():
+def test_delete_milestone(cli_runner, mock_client):
     """Test deleting a milestone."""
-    mock_client = MagicMock(spec=TestRailClient)
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["delete", "1", "--yes"],
         obj={"client": mock_client},
@@ -139,14 +115,15 @@ def test_delete_milestone():
     assert "deleted successfully" in result.stdout
 
 
-def test_delete_milestone_no_confirm():
+def test_delete_milestone_no_confirm(cli_runner, mock_client):
     """Test deleting a milestone without confirmation (abort)."""
-    mock_client = MagicMock(spec=TestRailClient)
 
-    result = runner.invoke(
+    result = cli_runner.invoke(
         app,
         ["delete", "1"],
         obj={"client": mock_client},
+        catch_exceptions=False,
+        color=False,
     )
 
     assert result.exit_code == 1
@@ -1,21 +1,18 @@
 """Unit tests for configuration management."""
 
-from pathlib import Path
-
 import pytest
 
 from testrail_cli.config import init_config, load_config, resolve_config
 
+pytestmark = pytest.mark.unit
+
 
 class TestLoadConfig:
     """Tests for load_config function."""
 
-    def test_load_config_with_explicit_path(self, tmp_path):
+    def test_load_config_with_explicit_path(self, sample_config_file):
         """Test loading config from explicit path."""
-        config_file = tmp_path / "test-config.yaml"
-        config_file.write_text("profiles:\n  default:\n    url: https://test.testrail.io\n")
-
-        config = load_config(str(config_file))
+        config = load_config(str(sample_config_file))
 
         assert "profiles" in config
         assert config["profiles"]["default"]["url"] == "https://test.testrail.io"
@@ -25,13 +22,14 @@ class TestLoadConfig:
         with pytest.raises(FileNotFoundError):
             load_config("/nonexistent/path.yaml")
 
-    def test_load_config_empty_when_no_file(self, tmp_path, monkeypatch):
+    @pytest.mark.usefixtures("isolated_home")
+    def test_load_config_empty_when_no_file(self):
         """Test loading config returns empty dict when no config file exists."""
-        monkeypatch.chdir(tmp_path)
         config = load_config()
         assert config == {}
 
 
+@pytest.mark.usefixtures("isolated_home")
 class TestResolveConfig:
     """Tests for resolve_config function."""
 
@@ -47,12 +45,11 @@ class TestResolveConfig:
         assert config["email"] == "cli@example.com"
         assert config["password"] == "cli_password"
 
-    def test_resolve_config_with_env_vars(self, monkeypatch, tmp_path):
+    def test_resolve_config_with_env_vars(self, monkeypatch):
         """Test config resolution with environment variables."""
         monkeypatch.setenv("TESTRAIL_URL", "https://env.testrail.io")
         monkeypatch.setenv("TESTRAIL_EMAIL", "env@example.com")
         monkeypatch.setenv("TESTRAIL_PASSWORD", "env_password")
-        monkeypatch.chdir(tmp_path)
 
         config = resolve_config()
 
@@ -60,27 +57,27 @@ class TestResolveConfig:
         assert config["email"] == "env@example.com"
         assert config["password"] == "env_password"
 
-    def test_resolve_config_missing_url_raises_error(self, tmp_path, monkeypatch):
-        """Test that missing URL raises ValueError."""
-        monkeypatch.chdir(tmp_path)
-        with pytest.raises(ValueError, match="TestRail URL is required"):
-            resolve_config()
-
-    def test_resolve_config_missing_email_raises_error(self, tmp_path, monkeypatch):
-        """Test that missing email raises ValueError."""
-        monkeypatch.chdir(tmp_path)
-        with pytest.raises(ValueError, match="TestRail email is required"):
-            resolve_config(url="https://test.testrail.io")
-
-    def test_resolve_config_missing_password_raises_error(self, tmp_path, monkeypatch):
-        """Test that missing password raises ValueError."""
-        monkeypatch.chdir(tmp_path)
-        with pytest.raises(ValueError, match="TestRail password/API key is required"):
-            resolve_config(url="https://test.testrail.io", email="test@example.com")
-
-    def test_resolve_config_defaults(self, tmp_path, monkeypatch):
+    @pytest.mark.parametrize(
+        ("kwargs", "match"),
+        [
+            pytest.param({}, "TestRail URL is required", id="url"),
+            pytest.param(
+                {"url": "https://test.testrail.io"}, "TestRail email is required", id="email"
+            ),
+            pytest.param(
+                {"url": "https://test.testrail.io", "email": "test@example.com"},
+                "TestRail password/API key is required",
+                id="password",
+            ),
+        ],
+    )
+    def test_resolve_config_missing_field_raises_error(self, kwargs, match):
+        """Test that each missing required field raises ValueError."""
+        with pytest.raises(ValueError, match=match):
+            resolve_config(**kwargs)
+
+    def test_resolve_config_defaults(self):
         """Test that defaults are applied correctly."""
-        monkeypatch.chdir(tmp_path)
         config = resolve_config(
             url="https://test.testrail.io",
             email="test@example.com",
@@ -91,9 +88,8 @@ class TestResolveConfig:
         assert config["verify"] is True
         assert config["proxy"] is None
 
-    def test_resolve_config_insecure_flag(self, tmp_path, monkeypatch):
+    def test_resolve_config_insecure_flag(self):
         """Test that insecure flag disables SSL verification."""
-        monkeypatch.chdir(tmp_path)
         config = resolve_config(
             url="https://test.testrail.io",
             email="test@example.com",
@@ -104,13 +100,12 @@ class TestResolveConfig:
         assert config["verify"] is False
 
 
+@pytest.mark.usefixtures("isolated_home")
 class TestInitConfig:
     """Tests for init_config function."""
 
-    def test_init_config_creates_new_file(self, tmp_path, monkeypatch):
+    def test_init_config_creates_new_file(self):
         """Test that init_config creates a new config file."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         config_path = init_config(
             profile="default",
             url="https://test.testrail.io",
@@ -121,10 +116,8 @@ class TestInitConfig:
         assert config_path.exists()
         assert config_path.name == ".testrail-cli.yaml"
 
-    def test_init_config_updates_existing_profile(self, tmp_path, monkeypatch):
+    def test_init_config_updates_existing_profile(self, isolated_home):
         """Test that init_config updates an existing profile."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         # Create initial config
         init_config(
             profile="default",
@@ -142,16 +135,14 @@ class TestInitConfig:
         )
 
         # Load and verify
-        config_path = tmp_path / ".testrail-cli.yaml"
+        config_path = isolated_home / ".testrail-cli.yaml"
         config = load_config(str(config_path))
 
         assert config["profiles"]["default"]["url"] == "https://test2.testrail.io"
         assert config["profiles"]["default"]["email"] == "test2@example.com"
 
-    def test_init_config_adds_new_profile(self, tmp_path, monkeypatch):
+    def test_init_config_adds_new_profile(self, isolated_home):
         """Test that init_config can add a new profile."""
-        monkeypatch.setattr(Path, "home", lambda: tmp_path)
-
         # Create default profile
         init_config(
             profile="default",
@@ -169,7 +160,7 @@ class TestInitConfig:
         )
 
         # Load and verify both profiles exist
-        config_path = tmp_path / ".testrail-cli.yaml"
+        config_path = isolated_home / ".testrail-cli.yaml"
         config = load_config(str(config_path))
 
         assert "default" in config["profiles"]
@@ -1,101 +1,69 @@
 """Tests for CSV import normalization."""
 
+import io
+import json
 from pathlib import Path
 
-from testrail_cli.csv_import import import_cases_from_csv
+import pytest
 
+from testrail_cli.csv_import import (
+    EXPORT_FIELDNAMES,
+    format_steps_as_text,
+    import_cases_from_csv,
+    normalize_row,
+)
 
-class StubTestRailClient:
-    """Lightweight stub client for CSV import tests."""
+from ._replay import ReplayClient
+from ._stub import StubTestRailClient
 
-    def __init__(self):
-        self.created_cases: list[dict] = []
-        self.updated_cases: list[dict] = []
-        self.sections = {10: {"id": 10, "name": "Auth", "parent_id": None}}
-        self.cases_for_export: list[dict] = []
+pytestmark = pytest.mark.unit
 
-    def get_suites(self, _project_id: int):
-        return [{"id": 1, "name": "Default"}]
 
-    def get_sections(self, _project_id: int, suite_id: int | None = None):
-        _ = suite_id
-        return list(self.sections.values())
-
-    def get_section(self, section_id: int):
-        return self.sections[section_id]
-
-    def add_section(self, _project_id: int, name: str, **kwargs):
-        # Mirrors TestRail structure
-        return {"id": 99, "name": name, **kwargs}
-
-    def add_case(self, section_id: int, title: str, **kwargs):
-        payload = {"section_id": section_id, "title": title, **kwargs}
-        self.created_cases.append(payload)
-        return {"id": len(self.created_cases), **payload}
-
-    def update_case(self, case_id: int, **kwargs):
-        payload = {"case_id": case_id, **kwargs}
-        self.updated_cases.append(payload)
-        return payload
-
-    def get_cases(self, _project_id: int, **kwargs):
-        _ = kwargs
-        return self.cases_for_export
-
-    def get_case(self, case_id: int):
-        for case in self.cases_for_export:
-            if case["id"] == case_id:
-                return case
-        raise KeyError(case_id)
-
-
-def _write_csv(tmp_path: Path, content: str) -> str:
+def _write_csv(tmp_path: Path, content: bytes) -> str:
     csv_path = tmp_path / "cases.csv"
-    csv_path.write_text(content)
+    csv_path.write_bytes(content)
     return str(csv_path)
 
 
-def test_import_cases_handles_teststeps_and_numbered_steps(tmp_path):
+def test_import_cases_handles_teststeps_and_numbered_steps(replay_client):
     """Multiple rows per case aggregate into custom_steps_separated."""
     csv_content = """case_id,title,section,step,expected
 ,Create with rows,Auth,Open login,Form shows
 ,Create with rows,Auth,Submit form,Success banner
 123,Update with rows,Auth,Add item,Item added
 """
-    csv_path = _write_csv(tmp_path, csv_content)
-    client = StubTestRailClient()
+    client = replay_client("csv_import.json")
 
-    result = import_cases_from_csv(client, project_id=1, csv_path=csv_path)
+    result = import_cases_from_csv(client, project_id=1, csv_path=io.StringIO(csv_content))
 
     assert result["errors"] == 0
     assert result["created"] == 1
     assert result["updated"] == 1
 
-    created_steps = client.created_cases[0]["custom_steps_separated"]
+    created_steps = client.calls["add_case"][0][1]["custom_steps_separated"]
     assert created_steps == [
         {"content": "Open login", "expected": "Form shows"},
         {"content": "Submit form", "expected": "Success banner"},
     ]
 
-    updated_steps = client.updated_cases[0]["custom_steps_separated"]
+    updated_steps = client.calls["update_case"][0][1]["custom_steps_separated"]
     assert updated_steps == [
         {"content": "Add item", "expected": "Item added"},
     ]
 
 
-def test_steps_field_respects_template_and_additional_info(tmp_path):
+def test_steps_field_respects_template_and_additional_info(replay_client):
     """steps_field override flattens steps to text and carries additional info."""
     csv_content = """case_id,title,section,step,expected,additional_info
 ,Text template uses blob,Auth,Do thing,Expect thing,Info A
 ,Text template uses blob,Auth,Second step,Second expected,Second info
 """
-    csv_path = _write_csv(tmp_path, csv_content)
-    client = StubTestRailClient()
+    client = replay_client("csv_import.json")
 
     result = import_cases_from_csv(
         client,
         project_id=1,
-        csv_path=csv_path,
+        csv_path=io.StringIO(csv_content),
         template_id=7,
         steps_field="custom_steps",
     )
@@ -103,7 +71,7 @@ def test_steps_field_respects_template_and_additional_info(tmp_path):
     assert result["errors"] == 0
     assert result["created"] == 1
 
-    case = client.created_cases[0]
+    case = client.calls["add_case"][0][1]
     assert case.get("template_id") == 7
     assert "custom_steps" in case
     assert "Do thing" in case["custom_steps"]
@@ -111,11 +79,31 @@ def test_steps_field_respects_template_and_additional_info(tmp_path):
     assert "Info: Info A" in case["custom_steps"]
 
 
-def test_export_cases_to_csv(tmp_path):
+def test_recording_never_forwards_writes(tmp_path):
+    """Recording an import sends only reads to the live client and tapes only reads."""
+    live = StubTestRailClient()
+    tape = tmp_path / "tape.json"
+    client = ReplayClient(tape, live=live)
+
+    result = import_cases_from_csv(
+        client, project_id=1, csv_path=io.StringIO("case_id,title,section\n,New,Auth\n5,Upd,Auth\n")
+    )
+
+    assert (result["created"], result["updated"]) == (1, 1)
+    assert live.created_cases == []
+    assert live.updated_cases == []
+    client.save()
+    assert {entry["method"] for entry in json.loads(tape.read_text())} == {
+        "get_suites",
+        "get_sections",
+    }
+
+
+def test_export_cases_to_csv(tmp_path, stub_testrail_client):
     """Export produces the same structure (one row per step)."""
     from testrail_cli.csv_import import export_cases_to_csv
 
-    client = StubTestRailClient()
+    client = stub_testrail_client
     client.sections[20] = {"id": 20, "name": "Login", "parent_id": 10}
     client.sections[10] = {"id": 10, "name": "Auth", "parent_id": None}
     client.cases_for_export = [
@@ -144,15 +132,77 @@ def test_export_cases_to_csv(tmp_path):
     assert "Auth/Login" in content
 
 
-def test_import_exploratory_template(tmp_path):
+def test_export_lists_sections_once_per_suite():
+    """Cases carrying suite_id get section paths from one get_sections call per suite."""
+    from testrail_cli.csv_import import export_cases_to_csv
+
+    class CountingClient(StubTestRailClient):
+        def __init__(self):
+            super().__init__()
+            self.section_listings: list[int | None] = []
+
+        def get_sections(self, _project_id: int, suite_id: int | None = None):
+            self.section_listings.append(suite_id)
+            return super().get_sections(_project_id, suite_id=suite_id)
+
+        def get_section(self, section_id: int):
+            raise AssertionError(f"unexpected get_section({section_id})")
+
+    client = CountingClient()
+    client.sections[20] = {"id": 20, "name": "Login", "parent_id": 10}
+    client.cases_for_export = [
+        {"id": 1, "title": "One", "suite_id": 3, "section_id": 20},
+        {"id": 2, "title": "Two", "suite_id": 3, "section_id": 10},
+        {"id": 3, "title": "Three", "suite_id": 3, "section_id": 20},
+    ]
+
+    out = io.StringIO()
+    export_cases_to_csv(client, project_id=1, csv_path=out)
+
+    assert client.section_listings == [3]
+    content = out.getvalue()
+    assert content.count("Auth/Login") == 2
+    assert "2,Two,Auth," in content
+
+
+def test_export_reads_paginated_section_listing():
+    """A paginated get_sections response is unwrapped; unlisted sections fall back."""
+    from testrail_cli.csv_import import export_cases_to_csv
+
+    class PaginatedClient(StubTestRailClient):
+        def get_sections(self, _project_id: int, suite_id: int | None = None):
+            _ = suite_id
+            return {
+                "offset": 0,
+                "limit": 250,
+                "size": 1,
+                "_links": {"next": "/api/v2/get_sections/1&suite_id=3&offset=250", "prev": None},
+                "sections": [self.sections[10]],
+            }
+
+    client = PaginatedClient()
+    client.sections[20] = {"id": 20, "name": "Login", "parent_id": 10}
+    client.cases_for_export = [
+        {"id": 1, "title": "One", "suite_id": 3, "section_id": 20},
+        {"id": 2, "title": "Two", "suite_id": 3, "section_id": 10},
+    ]
+
+    out = io.StringIO()
+    assert export_cases_to_csv(client, project_id=1, csv_path=out) == {"exported": 2}
+
+    content = out.getvalue()
+    assert "1,One,Auth/Login," in content
+    assert "2,Two,Auth," in content
+
+
+def test_import_exploratory_template(stub_testrail_client):
     """Import verifies standard fields are mapped to custom fields."""
     csv_content = """case_id,title,section,mission,goals
 ,Exploratory Session,Auth,Test mission,Test goals
 """
-    csv_path = _write_csv(tmp_path, csv_content)
-    client = StubTestRailClient()
+    client = stub_testrail_client
 
-    result = import_cases_from_csv(client, project_id=1, csv_path=csv_path)
+    result = import_cases_from_csv(client, project_id=1, csv_path=io.StringIO(csv_content))
 
     assert result["errors"] == 0
     assert result["created"] == 1
@@ -164,11 +214,11 @@ def test_import_exploratory_template(tmp_path):
     assert "goals" not in case
 
 
-def test_export_includes_template_fields(tmp_path):
+def test_export_includes_template_fields(stub_testrail_client):
     """Export includes mission, goals, and preconds."""
     from testrail_cli.csv_import import export_cases_to_csv
 
-    client = StubTestRailClient()
+    client = stub_testrail_client
     client.sections[10] = {"id": 10, "name": "Auth", "parent_id": None}
     client.cases_for_export = [
         {
@@ -182,11 +232,11 @@ def test_export_includes_template_fields(tmp_path):
         }
     ]
 
-    csv_path = tmp_path / "out.csv"
-    result = export_cases_to_csv(client, project_id=1, csv_path=str(csv_path))
+    out = io.StringIO()
+    result = export_cases_to_csv(client, project_id=1, csv_path=out)
     assert result["exported"] == 1
 
-    content = csv_path.read_text()
+    content = out.getvalue()
     assert "My Mission" in content
     assert "My Goals" in content
     assert "My Preconditions" in content
@@ -197,3 +247,193 @@ def test_export_includes_template_fields(tmp_path):
     assert "mission" in header
     assert "goals" in header
     assert "preconds" in header
+    assert header == ",".join(EXPORT_FIELDNAMES)
+
+
+def test_import_preserves_crlf_inside_quoted_fields(tmp_path, stub_testrail_client):
+    """CRLF row endings are handled by csv, and quoted line breaks survive verbatim."""
+    csv_path = _write_csv(
+        tmp_path,
+        b'case_id,title,section,preconds\r\n,Multi-line,Auth,"line one\r\nline two"\r\n',
+    )
+    client = stub_testrail_client
+
+    result = import_cases_from_csv(client, project_id=1, csv_path=csv_path)
+
+    assert result["errors"] == 0
+    assert client.created_cases[0]["custom_preconds"] == "line one\r\nline two"
+
+
+def test_import_groups_non_contiguous_rows(stub_testrail_client):
+    """Step rows for one case are aggregated even when interleaved with another case."""
+    csv_content = """case_id,title,section,step,expected
+,First,Auth,First step 1,Done 1
+,Second,Auth,Second step 1,Done 1
+,First,Auth,First step 2,Done 2
+"""
+    client = stub_testrail_client
+
+    result = import_cases_from_csv(client, project_id=1, csv_path=io.StringIO(csv_content))
+
+    assert result["created"] == 2
+    steps_by_title = {c["title"]: c["custom_steps_separated"] for c in client.created_cases}
+    assert [s["content"] for s in steps_by_title["First"]] == ["First step 1", "First step 2"]
+    assert [s["content"] for s in steps_by_title["Second"]] == ["Second step 1"]
+
+
+def test_import_concurrent_calls_keep_counts_and_errors():
+    """Concurrent updates count successes and report each failure; creates keep CSV order."""
+
+    class FlakyClient(StubTestRailClient):
+        def add_case(self, section_id: int, title: str, **kwargs):
+            if title == "Broken":
+                raise RuntimeError("server said no")
+            return super().add_case(section_id, title, **kwargs)
+
+        def update_case(self, case_id: int, **kwargs):
+            if case_id == 8:
+                raise RuntimeError("locked")
+            return super().update_case(case_id, **kwargs)
+
+    csv_content = """case_id,title,section
+,First,Auth
+,Broken,Auth
+,Third,Auth
+,Fourth,Auth
+7,Updated,Auth
+8,Locked,Auth
+9,Also updated,Auth
+"""
+    client = FlakyClient()
+
+    result = import_cases_from_csv(
+        client, project_id=1, csv_path=io.StringIO(csv_content), chunk_size=2, max_workers=4
+    )
+
+    assert result["created"] == 3
+    assert result["updated"] == 2
+    assert result["error_details"] == [
+        "Create error: server said no",
+        "Update error for case 8: locked",
+    ]
+    assert [c["title"] for c in client.created_cases] == ["First", "Third", "Fourth"]
+
+
+def test_format_steps_as_text_skips_empty_parts():
+    """Empty step parts are omitted and fully empty steps produce no line."""
+    steps = [
+        {"content": "Open", "expected": "Shown"},
+        {"content": "", "expected": "Only expected"},
+        {"content": "  ", "expected": "", "additional_info": ""},
+        {"content": "Close", "additional_info": "Note"},
+    ]
+
+    assert format_steps_as_text(steps) == (
+        "Open | Expected: Shown\nExpected: Only expected\nClose | Info: Note"
+    )
+
+
+def test_import_reads_paginated_section_listing():
+    """Section paths resolve against a paginated get_sections response."""
+
+    class PaginatedClient(StubTestRailClient):
+        def get_sections(self, _project_id: int, suite_id: int | None = None):
+            _ = suite_id
+            return {
+                "offset": 0,
+                "limit": 250,
+                "size": len(self.sections),
+                "_links": {"next": None, "prev": None},
+                "sections": list(self.sections.values()),
+            }
+
+    client = PaginatedClient()
+    client.sections[20] = {"id": 20, "name": "Login", "parent_id": 10}
+    csv_content = """case_id,title,section
+,One,Auth
+,Two,Auth/Login
+"""
+
+    result = import_cases_from_csv(client, project_id=1, csv_path=io.StringIO(csv_content))
+
+    assert result["errors"] == 0
+    assert [(c["section_id"], c["title"]) for c in client.created_cases] == [
+        (10, "One"),
+        (20, "Two"),
+    ]
+
+
+def test_import_lists_sections_once_and_reuses_created_sections():
+    """Sections are listed once per import and a created section is not recreated."""
+
+    class CountingClient(StubTestRailClient):
+        def __init__(self):
+            super().__init__()
+            self.section_listings = 0
+            self.added_sections: list[str] = []
+
+        def get_sections(self, _project_id: int, suite_id: int | None = None):
+            self.section_listings += 1
+            return super().get_sections(_project_id, suite_id=suite_id)
+
+        def add_section(self, _project_id: int, name: str, **kwargs):
+            self.added_sections.append(name)
+            return super().add_section(_project_id, name, **kwargs)
+
+    csv_content = """case_id,title,section
+,One,Auth
+,Two,Auth/New
+,Three,Auth/New
+,Four,Auth
+"""
+    client = CountingClient()
+
+    result = import_cases_from_csv(
+        client, project_id=1, csv_path=io.StringIO(csv_content), create_missing_sections=True
+    )
+
+    assert result["created"] == 4
+    assert client.section_listings == 1
+    assert client.added_sections == ["New"]
+    assert [c["section_id"] for c in client.created_cases] == [10, 99, 99, 10]
+
+
+def test_normalize_row_collects_numbered_step_columns():
+    """Numbered step/expected/info columns are folded into ordered steps."""
+    row = {
+        "title": "Numbered",
+        "Step 2": "Second",
+        "step_1": "First",
+        "Expected_1": "First ok",
+        "exp2": "Second ok",
+        "notes_1": "Careful",
+        "refs": "REQ-1",
+    }
+
+    normalized, errors = normalize_row(row, 2)
+
+    assert errors == []
+    assert normalized["custom_steps_separated"] == [
+        {"content": "First", "expected": "First ok", "additional_info": "Careful"},
+        {"content": "Second", "expected": "Second ok"},
+    ]
+    assert normalized["refs"] == "REQ-1"
+    assert "step_1" not in normalized
+
+
+def test_import_handles_ragged_rows_and_blank_lines(stub_testrail_client):
+    """Short rows, blank lines and trailing empty cells import; extra values are rejected."""
+    csv_content = """case_id,title,section,refs
+,Short row,Auth
+
+,Trailing empties,Auth,REF-1,,
+,Too wide,Auth,REF-2,surprise
+"""
+    client = stub_testrail_client
+
+    result = import_cases_from_csv(client, project_id=1, csv_path=io.StringIO(csv_content))
+
+    assert result["created"] == 2
+    assert result["error_details"] == ["Row 4: More values than header columns"]
+    assert [c["title"] for c in client.created_cases] == ["Short row", "Trailing empties"]
+    assert client.created_cases[1]["refs"] == "REF-1"
@@ -2,11 +2,24 @@
 
 import json
 
+import pytest
+from rich.console import Console
+
+from testrail_cli import io
 from testrail_cli.io import (
+    extract_paginated_data,
     filter_fields,
+    handle_api_error,
     output_json,
+    output_result,
+    output_table,
+    paginate_all,
+    parse_datetime,
+    parse_list,
 )
 
+pytestmark = pytest.mark.unit
+
 
 class TestOutputFunctions:
     """Tests for output formatting functions."""
@@ -29,6 +42,75 @@ class TestOutputFunctions:
         result = json.loads(captured.out)
         assert result == data
 
+    def test_output_json_matches_stdlib_without_orjson(self, capsys, monkeypatch):
+        """Test piped JSON is byte-identical whether or not orjson is installed."""
+        data = [{"id": 1, "name": "Tëst", "tags": ["a", "b"], "nested": {"x": None}}]
+        output_json(data)
+        default_out = capsys.readouterr().out
+
+        monkeypatch.setattr(io, "orjson", None)
+        output_json(data)
+        stdlib_out = capsys.readouterr().out
+
+        assert default_out == stdlib_out
+        assert json.loads(stdlib_out) == data
+
+    def test_output_json_lines(self, capsys):
+        """Test JSONL output writes one compact record per line."""
+        data = [{"id": 1, "name": "Tëst"}, {"id": 2, "tags": ["a"]}]
+        output_json(data, ["id", "name"], jsonl=True)
+
+        lines = capsys.readouterr().out.splitlines()
+        assert [json.loads(line) for line in lines] == [{"id": 1, "name": "Tëst"}, {"id": 2}]
+        assert lines[0] == '{"id":1,"name":"Tëst"}'
+
+    def test_output_json_lines_matches_stdlib_without_orjson(self, capsys, monkeypatch):
+        """Test JSONL bytes are the same with and without orjson."""
+        data = [{"id": 1, "nested": {"x": None}}, {"id": 2, "name": "Tëst"}]
+        output_json(data, jsonl=True)
+        default_out = capsys.readouterr().out
+
+        monkeypatch.setattr(io, "orjson", None)
+        output_json(data, jsonl=True)
+
+        assert capsys.readouterr().out == default_out
+
+    def test_output_result_jsonl_unwraps_pagination(self, capsys):
+        """Test the jsonl format emits the records of a paginated response."""
+        response = {"offset": 0, "limit": 250, "size": 2, "cases": [{"id": 1}, {"id": 2}]}
+        output_result(response, "jsonl")
+
+        assert capsys.readouterr().out == '{"id":1}\n{"id":2}\n'
+
+    def test_output_table_stream_chunks(self, capsys, monkeypatch):
+        """Test streamed tables print every row with a single header."""
+        monkeypatch.setattr(io, "TABLE_CHUNK_SIZE", 2)
+        monkeypatch.setattr(io, "console", Console(force_terminal=True))
+        data = [{"id": i, "name": f"Row{i}"} for i in range(5)]
+        output_table(data, stream=True)
+
+        captured = capsys.readouterr()
+        assert captured.out.count("name") == 1
+        assert all(f"Row{i}" in captured.out for i in range(5))
+
+    def test_output_table_piped_as_tsv(self, capsys):
+        """Test non-terminal table output is tab-separated."""
+        data = [{"id": 1, "name": "Test1", "extra": "x"}, {"id": 2}]
+        output_table(data, ["id", "name"])
+
+        captured = capsys.readouterr()
+        assert captured.out == "id\tname\n1\tTest1\n2\t\n"
+
+    @pytest.mark.parametrize("terminal", [True, False])
+    def test_output_table_renders_none_as_empty(self, capsys, monkeypatch, terminal):
+        """Test None cells are blank in both the Rich table and piped TSV."""
+        monkeypatch.setattr(io, "console", Console(force_terminal=terminal, width=80))
+        output_table([{"id": 1, "refs": None, "done": False}])
+
+        out = capsys.readouterr().out
+        assert "None" not in out
+        assert "False" in out
+
 
 class TestFilterFields:
     """Tests for filter_fields function."""
@@ -73,3 +155,216 @@ class TestFilterFields:
         result = filter_fields(data, fields)
 
         assert result == data
+
+    @pytest.mark.parametrize("data", [{"id": 1}, [{"id": 1}, {"id": 2}], "raw"])
+    def test_filter_fields_empty_returns_same_object(self, data):
+        """Test an empty field filter hands back the input without copying it."""
+        assert filter_fields(data, []) is data
+        assert filter_fields(data, frozenset()) is data
+
+    def test_filter_fields_list_with_divergent_rows(self):
+        """Test rows missing requested keys, or not dicts, survive the list fast path."""
+        data = [
+            {"id": 1, "name": "Test1", "description": "A test"},
+            {"id": 2, "description": "No name"},
+            "not-a-dict",
+            {"name": "Only name"},
+        ]
+
+        assert filter_fields(data, ["id", "name"]) == [
+            {"id": 1, "name": "Test1"},
+            {"id": 2},
+            "not-a-dict",
+            {"name": "Only name"},
+        ]
+        assert filter_fields(data, ["name"]) == [
+            {"name": "Test1"},
+            {},
+            "not-a-dict",
+            {"name": "Only name"},
+        ]
+
+
+class TestExtractPaginatedData:
+    """Tests for extract_paginated_data function."""
+
+    def test_extract_paginated_response(self):
+        """Test the resource array is unwrapped from pagination metadata."""
+        data = {"offset": 0, "limit": 250, "size": 1, "_links": {}, "runs": [{"id": 1}]}
+
+        assert extract_paginated_data(data) == [{"id": 1}]
+
+    def test_extract_known_key_without_metadata(self):
+        """Test known resource keys are unwrapped even without metadata."""
+        data = {"_links": {"next": None}, "cases": [{"id": 1}]}
+
+        assert extract_paginated_data(data) == [{"id": 1}]
+
+    def test_extract_plain_object_unchanged(self):
+        """Test single-object responses are returned as-is."""
+        data = {"id": 1, "name": "Case"}
+
+        assert extract_paginated_data(data) is data
+
+
+class TestPaginateAll:
+    """Tests for paginate_all function."""
+
+    def test_paginate_all_offset_fallback(self):
+        """Test bare-list pages are stepped by limit until a short page."""
+        items = [{"id": i} for i in range(5)]
+        calls = []
+
+        def fetch(offset, limit):
+            calls.append(offset)
+            return items[offset : offset + limit]
+
+        result = paginate_all(fetch, limit=2)
+
+        assert result == items
+        assert calls == [0, 2, 4]
+
+    def test_paginate_all_follows_next_link(self):
+        """Test _links.next drives the next request and null stops paging."""
+        pages = {
+            0: {
+                "offset": 0,
+                "limit": 2,
+                "size": 2,
+                "_links": {"next": "/api/v2/get_cases/1&limit=2&offset=2", "prev": None},
+                "cases": [{"id": 1}, {"id": 2}],
+            },
+            2: {
+                "offset": 2,
+                "limit": 2,
+                "size": 1,
+                "_links": {"next": None, "prev": "/api/v2/get_cases/1&limit=2&offset=0"},
+                "cases": [{"id": 3}],
+            },
+        }
+        calls = []
+
+        def fetch(offset, limit, project_id):
+            calls.append((offset, limit, project_id))
+            return pages[offset]
+
+        result = paginate_all(fetch, limit=2, project_id=1)
+
+        assert result == [{"id": 1}, {"id": 2}, {"id": 3}]
+        assert calls == [(0, 2, 1), (2, 2, 1)]
+
+    def test_paginate_all_concurrent_keeps_order(self):
+        """Test concurrent windows return results in offset order."""
+        items = [{"id": i} for i in range(7)]
+
+        def fetch(offset, limit):
+            return items[offset : offset + limit]
+
+        result = paginate_all(fetch, limit=2, max_workers=3)
+
+        assert result == items
+
+
+class TestParseDatetime:
+    """Tests for parse_datetime function."""
+
+    def test_parse_datetime_epoch(self):
+        """Test parsing epoch seconds."""
+        assert parse_datetime("1600000000") == 1600000000
+
+    def test_parse_datetime_iso8601_utc(self):
+        """Test parsing ISO8601 with a Z suffix."""
+        assert parse_datetime("2024-01-01T00:00:00Z") == 1704067200
+
+    def test_parse_datetime_iso8601_offset(self):
+        """Test parsing ISO8601 with an explicit UTC offset."""
+        assert parse_datetime("2024-01-01T02:00:00+02:00") == 1704067200
+
+    def test_parse_datetime_negative_epoch_rejected(self):
+        """Test out-of-range epoch seconds raise ValueError."""
+        with pytest.raises(ValueError, match="Invalid timestamp"):
+            parse_datetime("-5")
+
+    def test_parse_datetime_invalid_format(self):
+        """Test invalid input raises ValueError."""
+        with pytest.raises(ValueError, match="Invalid datetime format"):
+            parse_datetime("not-a-date")
+
+    @pytest.fixture
+    def without_ciso8601(self, monkeypatch):
+        """Force the pure-Python parser and drop results cached by other tests."""
+        monkeypatch.setattr(io, "ciso8601", None)
+        parse_datetime.cache_clear()
+        yield
+        parse_datetime.cache_clear()
+
+    @pytest.mark.parametrize(
+        ("value", "expected"),
+        [
+            ("2024-01-01T00:00:00Z", 1704067200),
+            ("2024-01-01T00:00:00.5Z", 1704067200),
+            ("2024-01-01T00:00:01.999999999+00:00", 1704067201),
+            ("2024-01-01 02:00:00+02:00", 1704067200),
+            ("2024-01-01T02:00:00+0200", 1704067200),
+            ("2023-12-31T18:30:00-05:30", 1704067200),
+            ("2023-12-31T19:00:00.250-0500", 1704067200),
+        ],
+    )
+    @pytest.mark.usefixtures("without_ciso8601")
+    def test_parse_datetime_fallback_parser(self, value, expected):
+        """Test the regex fast path handles fractions and colon, compact and negative offsets."""
+        assert parse_datetime(value) == expected
+
+    @pytest.mark.parametrize(
+        "value",
+        [
+            "2024-01-01T10:00:00+05:99",
+            "2024-01-01T10:00:00-0160",
+            "2024-01-01T10:00:00+24:00",
+            "\u0662\u0660\u0662\u0664-01-01T00:00:00",
+        ],
+    )
+    @pytest.mark.usefixtures("without_ciso8601")
+    def test_parse_datetime_fallback_rejects_invalid(self, value):
+        """Test out-of-range offsets and non-ASCII digits are rejected."""
+        with pytest.raises(ValueError, match="Invalid datetime format"):
+            parse_datetime(value)
+
+
+class TestParseList:
+    """Tests for parse_list function."""
+
+    def test_parse_list_single_value(self):
+        """Test a single value is returned without splitting."""
+        assert parse_list(" 1 ") == ["1"]
+
+    def test_parse_list_multiple_values(self):
+        """Test values are stripped and empty entries dropped."""
+        assert parse_list("1, 2,,3 ,") == ["1", "2", "3"]
+
+    def test_parse_list_blank(self):
+        """Test a blank string yields an empty list."""
+        assert parse_list("  ") == []
+
+
+class TestHandleApiError:
+    """Tests for handle_api_error function."""
+
+    def test_handle_api_error_uses_body_message(self, capsys):
+        """Test the TestRail error message is extracted from a bytes body."""
+        error = Exception(400, "Bad Request", "https://x", b'{"error": "Field :title is required"}')
+
+        with pytest.raises(SystemExit) as exc_info:
+            handle_api_error(error)
+
+        assert exc_info.value.code == 1
+        assert "HTTP 400: Field :title is required" in capsys.readouterr().err
+
+    def test_handle_api_error_non_json_body(self, capsys):
+        """Test a non-JSON body falls back to the HTTP reason."""
+        error = Exception(502, "Bad Gateway", "https://x", b"<html>oops</html>")
+
+        with pytest.raises(SystemExit):
+            handle_api_error(error)
+
+        assert "HTTP 502: Bad Gateway" in capsys.readouterr().err